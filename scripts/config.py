@@ -10,6 +10,12 @@ import yaml
 from pathlib import Path
 from dotenv import load_dotenv
 
+# libyaml's C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -36,7 +42,7 @@ def load_config(config_path='config.yaml'):
         )
 
     with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=_SafeLoader)
 
     # Substitute environment variables
     config = _substitute_env_vars(config)
@@ -83,6 +89,24 @@ except FileNotFoundError:
     print("⚠️  Warning: config.yaml not found. Please copy config.example.yaml to config.yaml")
 
 
+def reload_config(config_path='config.yaml'):
+    """
+    Re-read config.yaml after it has been edited in this process
+
+    config.yaml is parsed once on import and every accessor reads that copy,
+    so changes on disk are only picked up after calling this.
+
+    Args:
+        config_path: Path to config.yaml file (default: 'config.yaml' in project root)
+
+    Returns:
+        dict: Configuration dictionary
+    """
+    global CONFIG
+    CONFIG = load_config(config_path)
+    return CONFIG
+
+
 def get_config():
     """Get the loaded configuration"""
     if CONFIG is None:
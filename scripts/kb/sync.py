@@ -93,10 +93,9 @@ def sync_article_from_markdown(
     is_valid, msg = provider.validate_html(html_content)
     print(f"   {'✅' if is_valid else '❌'} {msg}")
 
-    # Load state to check if article exists
-    state_data = state_manager.load_state()
+    # Check state for an existing article (a copy, safe to hand to callers)
     state_key = f"{provider_name}:{article_key}"
-    existing_article = state_data.get('articles', {}).get(state_key)
+    existing_article = state_manager.get_article(state_key)
 
     # Create Article object
     article = Article(
@@ -196,17 +195,19 @@ def sync_multiple_articles(provider_name: str, articles: list[dict]) -> dict:
     provider_config = get_provider_config(provider_name)
     results = {}
 
-    for article_info in articles:
-        result = sync_article_from_markdown(
-            provider_name=provider_name,
-            markdown_path=article_info['file'],
-            article_key=article_info['key'],
-            title=article_info['title'],
-            slug=article_info['slug'],
-            collection_name=article_info['collection'],
-            provider_config=provider_config
-        )
-        results[article_info['key']] = result
+    # One state file write for the whole run instead of one per article
+    with state_manager.StateBatch():
+        for article_info in articles:
+            result = sync_article_from_markdown(
+                provider_name=provider_name,
+                markdown_path=article_info['file'],
+                article_key=article_info['key'],
+                title=article_info['title'],
+                slug=article_info['slug'],
+                collection_name=article_info['collection'],
+                provider_config=provider_config
+            )
+            results[article_info['key']] = result
 
     # Summary
     success_count = sum(1 for r in results.values() if r is not None)
@@ -220,9 +220,8 @@ class PylonSync:
         if img_count > 0:
             print(f"   {'✅' if is_valid else '❌'} {msg}")
 
-        # Load state to check if article exists
-        state_data = state_manager.load_state()
-        existing_article = state_data.get('articles', {}).get(article_key)
+        # Check state for an existing article (a copy, safe to hand to callers)
+        existing_article = state_manager.get_article(article_key)
 
         if existing_article and existing_article.get('article_id'):
             # Update existing article
@@ -272,25 +271,27 @@ def sync_documentation_category(category: str, articles: List[Dict]) -> Dict[str
 
     docs_base = cfg.get_documentation_config()['base_path']
 
-    for article in articles:
-        article_key = article['key']
-        article_file = article['file']
-        title = article['title']
-        slug = article['slug']
-
-        # Construct full path
-        markdown_path = os.path.join(docs_base, article_file)
-
-        # Sync
-        result = syncer.sync_article_from_markdown(
-            markdown_path=markdown_path,
-            article_key=article_key,
-            title=title,
-            slug=slug,
-            collection_name=category
-        )
+    # One state file write for the whole category instead of one per article
+    with state_manager.StateBatch():
+        for article in articles:
+            article_key = article['key']
+            article_file = article['file']
+            title = article['title']
+            slug = article['slug']
+
+            # Construct full path
+            markdown_path = os.path.join(docs_base, article_file)
+
+            # Sync
+            result = syncer.sync_article_from_markdown(
+                markdown_path=markdown_path,
+                article_key=article_key,
+                title=title,
+                slug=slug,
+                collection_name=category
+            )
 
-        results[article_key] = result
+            results[article_key] = result
 
     # Summary
     success_count = sum(1 for r in results.values() if r is not None)
@@ -5,8 +5,39 @@ This module defines the abstract base class that all screenshot
 capture implementations must inherit from (Playwright, Computer Use, etc.)
 """
 
+import os
 from abc import ABC, abstractmethod
 from typing import Optional, Callable
+from concurrent.futures import Future
+
+
+def write_if_changed(path: str, data: bytes) -> bool:
+    """
+    Write screenshot bytes unless the file already holds exactly them
+
+    Re-running a capture against an unchanged UI then leaves files (and
+    their timestamps) untouched. New content replaces the file atomically.
+
+    Args:
+        path: Output file path
+        data: Encoded image bytes
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    try:
+        if os.path.getsize(path) == len(data):
+            with open(path, 'rb') as f:
+                if f.read() == data:
+                    return False
+    except OSError:
+        pass  # No previous file
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return True
 
 
 class ScreenshotCapturerBase(ABC):
@@ -32,6 +63,10 @@ class ScreenshotCapturerBase(ABC):
         """Stop the capture session and clean up resources"""
         pass
 
+    def is_alive(self) -> bool:
+        """Whether a started session can still be used (checked before reuse)"""
+        return True
+
     @abstractmethod
     def navigate(self, url: str, wait_for: str = 'networkidle', timeout: int = 30000):
         """
@@ -75,6 +110,18 @@ class ScreenshotCapturerBase(ABC):
         """
         pass
 
+    def wait_until_stable(self, timeout: int):
+        """
+        Wait for the page to settle, for at most timeout milliseconds
+
+        Implementations that can observe the page should return as soon as it
+        is stable; the default simply waits the full time.
+
+        Args:
+            timeout: Maximum time to wait in milliseconds
+        """
+        self.wait(timeout)
+
     @abstractmethod
     def scroll_to(self, selector: str):
         """
@@ -105,6 +152,33 @@ class ScreenshotCapturerBase(ABC):
         """
         pass
 
+    def capture_async(
+        self,
+        filename: str,
+        selector: Optional[str] = None,
+        full_page: bool = False
+    ) -> Future:
+        """
+        Capture a screenshot, letting the file save finish in the background
+
+        The screen is captured before returning; the future resolves once the
+        file is written. The default saves synchronously.
+
+        Args:
+            filename: Output filename (without extension)
+            selector: CSS selector to capture specific element (optional)
+            full_page: Capture full scrollable page (default: False)
+
+        Returns:
+            Future resolving to the path of the saved screenshot
+        """
+        future = Future()
+        try:
+            future.set_result(self.capture(filename, selector=selector, full_page=full_page))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
     @abstractmethod
     def run_workflow(self, workflow: Callable):
         """
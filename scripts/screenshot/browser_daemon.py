@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Long-lived Chromium for screenshot capture
+
+Launches Chromium once with a remote debugging port and keeps it running,
+so capture scripts connect to it over CDP instead of paying the browser
+cold start on every run. Each capture opens its own context and pages and
+closes only those when it is done.
+
+Usage:
+    python scripts/screenshot/browser_daemon.py --port 9222
+    export CAPTURE_CDP_URL=http://localhost:9222
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from screenshot.capture import BROWSER_ARGS
+from playwright.async_api import async_playwright
+
+
+async def serve(port: int = 9222, headless: bool = True):
+    """
+    Run Chromium until it exits or the daemon is interrupted
+
+    Args:
+        port: Remote debugging port to listen on
+        headless: Run browser in headless mode (default: True)
+    """
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(
+            headless=headless,
+            args=[f'--remote-debugging-port={port}', *BROWSER_ARGS]
+        )
+
+        closed = asyncio.Event()
+        browser.on('disconnected', lambda _: closed.set())
+
+        print(f"🌐 Browser ready for capture scripts")
+        print(f"   export CAPTURE_CDP_URL=http://localhost:{port}")
+        print(f"   Press Ctrl+C to stop\n")
+
+        await closed.wait()
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Keep a Chromium instance running for screenshot capture'
+    )
+    parser.add_argument(
+        '--port',
+        type=int,
+        default=9222,
+        help='Remote debugging port (default: 9222)'
+    )
+    parser.add_argument(
+        '--headed',
+        action='store_true',
+        help='Show the browser window'
+    )
+
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args.port, headless=not args.headed))
+    except KeyboardInterrupt:
+        print("\n✅ Browser closed")
@@ -8,6 +8,9 @@ of web applications with authentication support.
 import os
 import json
 from playwright.sync_api import sync_playwright, Page, BrowserContext
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import async_playwright
+from playwright.async_api import TimeoutError as AsyncPlaywrightTimeoutError
 from pathlib import Path
 from typing import Optional, Dict, Callable
 import sys
@@ -15,7 +18,111 @@ import sys
 # Add parent directory to path for config import
 sys.path.insert(0, str(Path(__file__).parent.parent))
 import config as cfg
-from screenshot.base import ScreenshotCapturerBase
+from screenshot.base import ScreenshotCapturerBase, write_if_changed
+
+# Chromium flags for launched browsers; /dev/shm is tiny in most containers
+BROWSER_ARGS = ['--disable-dev-shm-usage']
+
+
+def _launch_browser(playwright, headless: bool):
+    """
+    Connect to the browser at CAPTURE_CDP_URL, or launch a new one
+
+    Args:
+        playwright: Started sync Playwright instance
+        headless: Run a launched browser in headless mode
+
+    Returns:
+        (browser, connected) where connected is True for a shared browser
+    """
+    cdp_url = os.getenv('CAPTURE_CDP_URL')
+    if cdp_url:
+        try:
+            browser = playwright.chromium.connect_over_cdp(cdp_url)
+            print(f"   Connected to running browser: {cdp_url}")
+            return browser, True
+        except Exception as e:
+            print(f"   ⚠️  Could not connect to {cdp_url}: {e}")
+            print(f"      Launching a new browser instead")
+
+    return playwright.chromium.launch(headless=headless, args=BROWSER_ARGS), False
+
+
+async def _launch_browser_async(playwright, headless: bool):
+    """Async counterpart of _launch_browser"""
+    cdp_url = os.getenv('CAPTURE_CDP_URL')
+    if cdp_url:
+        try:
+            browser = await playwright.chromium.connect_over_cdp(cdp_url)
+            print(f"   Connected to running browser: {cdp_url}")
+            return browser, True
+        except Exception as e:
+            print(f"   ⚠️  Could not connect to {cdp_url}: {e}")
+            print(f"      Launching a new browser instead")
+
+    return await playwright.chromium.launch(headless=headless, args=BROWSER_ARGS), False
+
+
+def _resolve_settings(
+    auth_session_file: Optional[str],
+    viewport_width: Optional[int],
+    viewport_height: Optional[int],
+    output_dir: Optional[str]
+) -> tuple:
+    """
+    Fill in capture settings that were not given from config
+
+    Returns:
+        (auth_session_file, viewport_width, viewport_height, output_dir)
+    """
+    try:
+        config = cfg.get_screenshot_config()
+        return (
+            auth_session_file or config['auth_session_file'],
+            viewport_width or config['viewport_width'],
+            viewport_height or config['viewport_height'],
+            output_dir or config['output_dir'],
+        )
+    except:
+        # Fallback defaults if config not available
+        return (
+            auth_session_file or './scripts/auth_session.json',
+            viewport_width or 1470,
+            viewport_height or 840,
+            output_dir or './demo/docs/product_documentation/screenshots',
+        )
+
+
+def _load_storage_state(auth_session_file: str) -> Optional[dict]:
+    """
+    Load a saved authentication session if available
+
+    Args:
+        auth_session_file: Path to saved auth session
+
+    Returns:
+        Playwright storage state, or None if no session was saved
+    """
+    if not os.path.exists(auth_session_file):
+        print(f"   ⚠️  No auth session found: {auth_session_file}")
+        print(f"      Screenshots may fail if authentication is required")
+        print(f"      Run auth_manager.py first to save a session")
+        return None
+
+    print(f"   Loading auth session: {auth_session_file}")
+    with open(auth_session_file, 'r') as f:
+        return json.load(f)
+
+
+def _screenshot_path(output_dir: str, filename: str) -> str:
+    """Ensure the output directory exists and return the .png path for filename"""
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Add .png extension if not present
+    if not filename.endswith('.png'):
+        filename += '.png'
+
+    return os.path.join(output_dir, filename)
 
 
 class ScreenshotCapturer(ScreenshotCapturerBase):
@@ -39,22 +146,17 @@ class ScreenshotCapturer(ScreenshotCapturerBase):
             output_dir: Directory to save screenshots (default: from config)
             headless: Run browser in headless mode (default: True)
         """
-        try:
-            config = cfg.get_screenshot_config()
-            self.auth_session_file = auth_session_file or config['auth_session_file']
-            self.viewport_width = viewport_width or config['viewport_width']
-            self.viewport_height = viewport_height or config['viewport_height']
-            self.output_dir = output_dir or config['output_dir']
-        except:
-            # Fallback defaults if config not available
-            self.auth_session_file = auth_session_file or './scripts/auth_session.json'
-            self.viewport_width = viewport_width or 1470
-            self.viewport_height = viewport_height or 840
-            self.output_dir = output_dir or './demo/docs/product_documentation/screenshots'
+        (
+            self.auth_session_file,
+            self.viewport_width,
+            self.viewport_height,
+            self.output_dir
+        ) = _resolve_settings(auth_session_file, viewport_width, viewport_height, output_dir)
 
         self.headless = headless
         self.playwright = None
         self.browser = None
+        self.connected = False
         self.context = None
         self.page = None
 
@@ -74,23 +176,12 @@ class ScreenshotCapturer(ScreenshotCapturerBase):
         print(f"   Headless: {self.headless}")
 
         self.playwright = sync_playwright().start()
-        self.browser = self.playwright.chromium.launch(headless=self.headless)
-
-        # Load authentication session if available
-        storage_state = None
-        if os.path.exists(self.auth_session_file):
-            print(f"   Loading auth session: {self.auth_session_file}")
-            with open(self.auth_session_file, 'r') as f:
-                storage_state = json.load(f)
-        else:
-            print(f"   ⚠️  No auth session found: {self.auth_session_file}")
-            print(f"      Screenshots may fail if authentication is required")
-            print(f"      Run auth_manager.py first to save a session")
+        self.browser, self.connected = _launch_browser(self.playwright, self.headless)
 
         # Create browser context with auth
         self.context = self.browser.new_context(
             viewport={'width': self.viewport_width, 'height': self.viewport_height},
-            storage_state=storage_state
+            storage_state=_load_storage_state(self.auth_session_file)
         )
 
         self.page = self.context.new_page()
@@ -98,12 +189,20 @@ class ScreenshotCapturer(ScreenshotCapturerBase):
 
     def stop(self):
         """Stop browser"""
-        if self.browser:
+        if self.connected:
+            # Shared browser: close our context, leave the browser running
+            if self.context:
+                self.context.close()
+        elif self.browser:
             self.browser.close()
         if self.playwright:
             self.playwright.stop()
         print("\n✅ Browser closed")
 
+    def is_alive(self) -> bool:
+        """Whether the browser is still connected"""
+        return self.browser is not None and self.browser.is_connected()
+
     def navigate(self, url: str, wait_for: str = 'networkidle', timeout: int = 30000):
         """
         Navigate to a URL
@@ -147,6 +246,18 @@ class ScreenshotCapturer(ScreenshotCapturerBase):
         """
         self.page.wait_for_timeout(milliseconds)
 
+    def wait_until_stable(self, timeout: int):
+        """
+        Wait until the network is idle, for at most timeout milliseconds
+
+        Args:
+            timeout: Maximum time to wait in milliseconds
+        """
+        try:
+            self.page.wait_for_load_state('networkidle', timeout=timeout)
+        except PlaywrightTimeoutError:
+            pass  # Still busy; capture what is there
+
     def scroll_to(self, selector: str):
         """
         Scroll to an element
@@ -179,31 +290,27 @@ class ScreenshotCapturer(ScreenshotCapturerBase):
         Returns:
             Path to saved screenshot
         """
-        # Ensure output directory exists
-        os.makedirs(self.output_dir, exist_ok=True)
-
-        # Add .png extension if not present
-        if not filename.endswith('.png'):
-            filename += '.png'
+        output_path = _screenshot_path(self.output_dir, filename)
 
-        output_path = os.path.join(self.output_dir, filename)
-
-        print(f"📸 Capturing: {filename}")
+        print(f"📸 Capturing: {os.path.basename(output_path)}")
 
         if selector:
             # Capture specific element
             element = self.page.query_selector(selector)
             if element:
-                element.screenshot(path=output_path)
+                data = element.screenshot()
             else:
                 print(f"   ⚠️  Element not found: {selector}")
                 print(f"   Capturing full page instead")
-                self.page.screenshot(path=output_path, full_page=full_page)
+                data = self.page.screenshot(full_page=full_page)
         else:
             # Capture full page or viewport
-            self.page.screenshot(path=output_path, full_page=full_page)
+            data = self.page.screenshot(full_page=full_page)
 
-        print(f"   ✅ Saved: {output_path}")
+        if write_if_changed(output_path, data):
+            print(f"   ✅ Saved: {output_path}")
+        else:
+            print(f"   ✅ Unchanged: {output_path}")
         return output_path
 
     def run_workflow(self, workflow: Callable[[Page], None]):
@@ -227,6 +334,154 @@ class ScreenshotCapturer(ScreenshotCapturerBase):
         workflow(self.page)
 
 
+class AsyncBrowserSession:
+    """
+    One warm headless browser shared by concurrent captures
+
+    The browser and its authenticated context are launched once; each
+    capture opens its own page and closes only that page, so the cold start
+    is paid once per plan instead of once per worker.
+    """
+
+    def __init__(
+        self,
+        auth_session_file: Optional[str] = None,
+        viewport_width: Optional[int] = None,
+        viewport_height: Optional[int] = None,
+        output_dir: Optional[str] = None,
+        headless: bool = True
+    ):
+        """
+        Initialize browser session
+
+        Args:
+            auth_session_file: Path to saved auth session (default: from config)
+            viewport_width: Browser viewport width (default: from config)
+            viewport_height: Browser viewport height (default: from config)
+            output_dir: Directory to save screenshots (default: from config)
+            headless: Run browser in headless mode (default: True)
+        """
+        (
+            self.auth_session_file,
+            self.viewport_width,
+            self.viewport_height,
+            self.output_dir
+        ) = _resolve_settings(auth_session_file, viewport_width, viewport_height, output_dir)
+
+        self.headless = headless
+        self.playwright = None
+        self.browser = None
+        self.connected = False
+        self.context = None
+
+    async def __aenter__(self):
+        """Launch the browser and authenticated context"""
+        print(f"🌐 Starting browser...")
+        print(f"   Viewport: {self.viewport_width}x{self.viewport_height}")
+        print(f"   Headless: {self.headless}")
+
+        self.playwright = await async_playwright().start()
+        try:
+            self.browser, self.connected = await _launch_browser_async(self.playwright, self.headless)
+            self.context = await self.browser.new_context(
+                viewport={'width': self.viewport_width, 'height': self.viewport_height},
+                storage_state=_load_storage_state(self.auth_session_file)
+            )
+        except BaseException:
+            await self.__aexit__(None, None, None)
+            raise
+
+        print("   ✅ Browser ready\n")
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Close the browser"""
+        if self.connected:
+            # Shared browser: close our context, leave the browser running
+            if self.context:
+                await self.context.close()
+        elif self.browser:
+            await self.browser.close()
+        if self.playwright:
+            await self.playwright.stop()
+        print("\n✅ Browser closed")
+
+    async def capture_one(
+        self,
+        url: str,
+        filename: str,
+        wait_for: Optional[str] = None,
+        wait_time: Optional[int] = None,
+        selector: Optional[str] = None,
+        scroll_to: Optional[str] = None,
+        full_page: bool = False
+    ) -> str:
+        """
+        Capture one screenshot on a fresh page of the shared browser
+
+        Follows the same steps as the sync capturer: navigate, wait for
+        wait_for (or for the network to settle within wait_time), scroll,
+        then capture.
+
+        Args:
+            url: Absolute URL to capture
+            filename: Output filename (without extension)
+            wait_for: CSS selector that signals the page is ready (optional)
+            wait_time: Upper bound in milliseconds for the page to settle (optional)
+            selector: CSS selector to capture specific element (optional)
+            scroll_to: CSS selector to scroll into view first (optional)
+            full_page: Capture full scrollable page (default: False)
+
+        Returns:
+            Path to saved screenshot
+        """
+        page = await self.context.new_page()
+        try:
+            print(f"📍 Navigating to: {url}")
+            await page.goto(url, wait_until='networkidle', timeout=30000)
+
+            if wait_for is not None:
+                print(f"   ⏳ Waiting for: {wait_for}")
+                # wait_time, when given, bounds the selector wait
+                await page.wait_for_selector(
+                    wait_for, timeout=wait_time if wait_time is not None else 10000
+                )
+            elif wait_time is not None:
+                try:
+                    await page.wait_for_load_state('networkidle', timeout=wait_time)
+                except AsyncPlaywrightTimeoutError:
+                    pass  # Still busy; capture what is there
+
+            if scroll_to is not None:
+                await page.evaluate(f'''
+                    document.querySelector("{scroll_to}").scrollIntoView({{
+                        behavior: "smooth",
+                        block: "center"
+                    }})
+                ''')
+                await page.wait_for_timeout(500)  # Wait for scroll to complete
+
+            output_path = _screenshot_path(self.output_dir, filename)
+            print(f"📸 Capturing: {os.path.basename(output_path)}")
+
+            element = await page.query_selector(selector) if selector else None
+            if element:
+                data = await element.screenshot()
+            else:
+                if selector:
+                    print(f"   ⚠️  Element not found: {selector}")
+                    print(f"   Capturing full page instead")
+                data = await page.screenshot(full_page=full_page)
+
+            if write_if_changed(output_path, data):
+                print(f"   ✅ Saved: {output_path}")
+            else:
+                print(f"   ✅ Unchanged: {output_path}")
+            return output_path
+        finally:
+            await page.close()
+
+
 def capture_screenshots_from_plan(plan: list, base_url: str, implementation="auto"):
     """
     Capture screenshots based on a plan
@@ -255,6 +510,11 @@ def capture_screenshots_from_plan(plan: list, base_url: str, implementation="aut
             }
         ]
     """
+    from screenshot.factory import PlanItem
+
+    # Validate the whole plan before launching a browser
+    items = [PlanItem.from_dict(item) for item in plan]
+
     # For backward compatibility, use factory if not "auto" or if config specifies Computer Use
     if implementation != "auto":
         from screenshot.factory import create_capturer
@@ -272,33 +532,30 @@ def capture_screenshots_from_plan(plan: list, base_url: str, implementation="aut
             capturer_instance = ScreenshotCapturer()
 
     with capturer_instance as capturer:
-        for item in plan:
-            name = item['name']
-            url = base_url + item.get('url', '')
-
+        for item in items:
             # Navigate
-            capturer.navigate(url)
+            capturer.navigate(base_url + item.url)
 
             # Wait for specific element if specified
-            if 'wait_for' in item:
-                capturer.wait_for_selector(item['wait_for'])
+            if item.wait_for is not None:
+                capturer.wait_for_selector(item.wait_for)
 
             # Additional wait time
-            if 'wait_time' in item:
-                capturer.wait(item['wait_time'])
+            if item.wait_time is not None:
+                capturer.wait(item.wait_time)
 
             # Scroll to element if specified
-            if 'scroll_to' in item:
-                capturer.scroll_to(item['scroll_to'])
+            if item.scroll_to is not None:
+                capturer.scroll_to(item.scroll_to)
 
             # Capture
             capturer.capture(
-                filename=name,
-                selector=item.get('selector'),
-                full_page=item.get('full_page', False)
+                filename=item.name,
+                selector=item.selector,
+                full_page=item.full_page
             )
 
-    print(f"\n✅ Captured {len(plan)} screenshots")
+    print(f"\n✅ Captured {len(items)} screenshots")
 
 
 if __name__ == '__main__':
@@ -335,7 +592,7 @@ if __name__ == '__main__':
 
     with ScreenshotCapturer(headless=not args.no_headless) as capturer:
         capturer.navigate(args.url)
-        capturer.wait(2000)  # Wait for page to stabilize
+        capturer.wait_until_stable(2000)  # Wait for page to stabilize
         capturer.capture(
             filename=args.output,
             selector=args.selector,
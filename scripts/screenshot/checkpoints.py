@@ -0,0 +1,50 @@
+"""
+Named checkpoints for multi-step Computer Use tasks
+
+Several UI states can be captured in one agent session instead of one
+session per state: the task prompt lists the checkpoint names, the agent
+announces each one as it reaches it, and the client keeps the screenshot
+that was current at that moment.
+"""
+
+import re
+from typing import Iterable, List
+
+# Marker the agent writes on its own line when a checkpoint is reached
+CHECKPOINT_PATTERN = re.compile(r'^\s*CHECKPOINT:\s*(\S+)\s*$', re.MULTILINE)
+
+
+def checkpoint_instructions(names: Iterable[str]) -> str:
+    """
+    Build the prompt section that asks the agent to announce checkpoints
+
+    Args:
+        names: Checkpoint names, in the order they are expected
+
+    Returns:
+        Text to append to the task prompt
+    """
+    listed = '\n'.join(f"- {name}" for name in names)
+    return f"""
+CHECKPOINTS:
+Some steps end in a state that must be captured. When you reach one, take a
+screenshot, verify it shows the expected state, then write a line of the
+form "CHECKPOINT: <name>" before continuing with the next step.
+Checkpoint names:
+{listed}
+"""
+
+
+def find_checkpoints(text: str, names: Iterable[str]) -> List[str]:
+    """
+    Find checkpoint markers in agent text
+
+    Args:
+        text: Text written by the agent
+        names: Checkpoint names that were requested
+
+    Returns:
+        Requested checkpoint names announced in text, in order
+    """
+    wanted = set(names)
+    return [name for name in CHECKPOINT_PATTERN.findall(text or '') if name in wanted]
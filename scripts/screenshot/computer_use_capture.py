@@ -9,15 +9,16 @@ autonomous navigation, solving authentication and reliability issues.
 import os
 import sys
 import time
+import base64
 import asyncio
 from pathlib import Path
-from typing import Optional, Dict, Callable
+from typing import Optional, Dict, List, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from screenshot.base import ScreenshotCapturerBase
-from screenshot.computer_use_client import ComputerUseClient
+from screenshot.base import ScreenshotCapturerBase, write_if_changed
 from screenshot.computer_use_tools import ComputerUseTool
 
 try:
@@ -65,6 +66,8 @@ class ComputerUseScreenshotCapturer(ScreenshotCapturerBase):
                 self.viewport_width = viewport_width or screenshot_config.get('viewport_width', 1280)
                 self.viewport_height = viewport_height or screenshot_config.get('viewport_height', 800)
                 self.output_dir = output_dir or screenshot_config.get('output_dir', './output/screenshots')
+                self.image_format = screenshot_config.get('format', 'png')
+                self.image_quality = screenshot_config.get('quality', 90)
 
                 # API configuration
                 self.anthropic_key = api_key or os.getenv('ANTHROPIC_API_KEY') or screenshot_config.get('api_key')
@@ -132,6 +135,7 @@ class ComputerUseScreenshotCapturer(ScreenshotCapturerBase):
                 display_height=self.viewport_height
             )
         else:
+            from screenshot.computer_use_client import ComputerUseClient
             self.client = ComputerUseClient(
                 api_key=self.api_key,
                 model=self.model,
@@ -141,7 +145,9 @@ class ComputerUseScreenshotCapturer(ScreenshotCapturerBase):
 
         self.tool_executor = ComputerUseTool(
             display_width=self.viewport_width,
-            display_height=self.viewport_height
+            display_height=self.viewport_height,
+            image_format=self.image_format,
+            quality=self.image_quality
         )
 
         # Connect client and executor
@@ -152,11 +158,24 @@ class ComputerUseScreenshotCapturer(ScreenshotCapturerBase):
         self.current_url = None
         self.authenticated = False
 
+        # Opt-in (USE_DIRECT_NAV=1): steps with a known key sequence skip the
+        # model. The keys go to whichever window has focus, so only enable it
+        # when the browser is guaranteed to be focused (e.g. a kiosk desktop).
+        self.direct_navigation = os.getenv('USE_DIRECT_NAV') == '1'
+
+        # Saves screenshots in the background (see capture_async)
+        self._writer = None
+
+        # One event loop for the whole session (see _run)
+        self._loop = None
+
     def _set_defaults(self, viewport_width, viewport_height, output_dir, api_key, model, auth_credentials):
         """Set default values when config is not available"""
         self.viewport_width = viewport_width or 1280
         self.viewport_height = viewport_height or 800
         self.output_dir = output_dir or './output/screenshots'
+        self.image_format = 'png'
+        self.image_quality = 90
         
         # Determine provider based on keys
         google_key = os.getenv('GOOGLE_API_KEY')
@@ -202,10 +221,35 @@ class ComputerUseScreenshotCapturer(ScreenshotCapturerBase):
 
     def stop(self):
         """Stop session"""
+        if self._writer is not None:
+            # Let pending screenshot saves finish
+            self._writer.shutdown(wait=True)
+            self._writer = None
+
+        if self._loop is not None:
+            self._loop.close()
+            self._loop = None
+
         self.session_active = False
         self.authenticated = False
         print("\n✅ Session closed")
 
+    def _run(self, coro):
+        """
+        Run a client or tool coroutine to completion on the session's loop
+
+        Every step reuses the same event loop instead of asyncio.run()
+        creating and tearing one down, so loop-bound client state such as
+        the Gemini connection survives from one step to the next.
+        """
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+
+    def is_alive(self) -> bool:
+        """Whether the session has been started and not stopped"""
+        return self.session_active
+
     def _authenticate(self):
         """Authenticate using Computer Use visual navigation"""
         print("🔐 Authenticating...")
@@ -214,7 +258,7 @@ class ComputerUseScreenshotCapturer(ScreenshotCapturerBase):
         system_prompt = self._build_auth_system_prompt()
 
         try:
-            result = asyncio.run(self.client.execute_task(
+            result = self._run(self.client.execute_task(
                 task_prompt=auth_prompt,
                 system_prompt=system_prompt,
                 max_iterations=25,
@@ -285,10 +329,14 @@ CRITICAL INSTRUCTIONS:
         Args:
             url: URL to navigate to
             wait_for: Ignored (Computer Use handles waiting naturally)
-            timeout: Ignored (Computer Use uses max_iterations)
+            timeout: Upper bound for the page to settle in milliseconds
+                (only used with USE_DIRECT_NAV=1; the model loop uses max_iterations)
         """
         print(f"📍 Navigating to: {url}")
 
+        if self.direct_navigation and self._navigate_direct(url, timeout):
+            return
+
         prompt = f"""Navigate to {url} in the web browser.
 
 Steps:
@@ -302,7 +350,7 @@ IMPORTANT: Wait until you see the actual page content before confirming success.
 """
 
         try:
-            result = asyncio.run(self.client.execute_task(
+            result = self._run(self.client.execute_task(
                 task_prompt=prompt,
                 max_iterations=15,
                 verbose=False
@@ -318,6 +366,48 @@ IMPORTANT: Wait until you see the actual page content before confirming success.
             print(f"   ❌ Navigation error: {e}")
             raise RuntimeError(f"Navigation failed: {e}")
 
+    def _navigate_direct(self, url: str, timeout: int) -> bool:
+        """
+        Navigate with a fixed key sequence instead of a model loop
+
+        Focusing the address bar, typing the URL and pressing Enter needs no
+        visual reasoning, so the actions are sent straight to the desktop and
+        the wait ends once the screen stops changing. If the settled screen
+        is the same as before the keys were sent, nothing navigated (the
+        browser likely didn't have focus) and the caller should fall back
+        to the model.
+
+        Args:
+            url: URL to navigate to
+            timeout: Maximum time to wait for the page to settle in milliseconds
+
+        Returns:
+            True if the screen changed and settled, False otherwise
+        """
+        address_bar = 'command+l' if sys.platform == 'darwin' else 'ctrl+l'
+
+        async def run():
+            before = await self.tool_executor.execute_action("screenshot", {})
+            await self.tool_executor.execute_action("key", {"key": address_bar})
+            await self.tool_executor.execute_action("type", {"text": url})
+            await self.tool_executor.execute_action("key", {"key": "enter"})
+            return before
+
+        try:
+            before = self._run(run())
+        except Exception as e:
+            print(f"   ❌ Navigation error: {e}")
+            raise RuntimeError(f"Navigation failed: {e}")
+
+        after = self._settled_frame(timeout)
+        if after == before:
+            print(f"   ⚠️  Screen didn't change after typing the URL, navigating with the model")
+            return False
+
+        self.current_url = url
+        print(f"   ✅ Page loaded")
+        return True
+
     def wait_for_selector(self, selector: str, timeout: int = 10000):
         """
         Wait for element to appear (Computer Use adaptation)
@@ -343,7 +433,7 @@ Confirm when you see the element.
 """
 
         try:
-            asyncio.run(self.client.execute_task(
+            self._run(self.client.execute_task(
                 task_prompt=prompt,
                 max_iterations=8,
                 verbose=False
@@ -376,7 +466,7 @@ Verify the click had the expected effect.
 """
 
         try:
-            asyncio.run(self.client.execute_task(
+            self._run(self.client.execute_task(
                 task_prompt=prompt,
                 max_iterations=8,
                 verbose=False
@@ -394,6 +484,39 @@ Verify the click had the expected effect.
         """
         time.sleep(milliseconds / 1000.0)
 
+    def wait_until_stable(self, timeout: int, interval: int = 200):
+        """
+        Wait until two consecutive screenshots are identical
+
+        There is no DOM to inspect, so the screen is polled instead and the
+        wait ends as soon as rendering has settled.
+
+        Args:
+            timeout: Maximum time to wait in milliseconds
+            interval: Delay between screenshots in milliseconds
+        """
+        self._settled_frame(timeout, interval)
+
+    def _settled_frame(self, timeout: int, interval: int = 200) -> Optional[str]:
+        """
+        Poll the screen until it settles (see wait_until_stable)
+
+        Returns:
+            The settled screenshot, or the last one taken if the timeout
+            ran out first
+        """
+        deadline = time.monotonic() + timeout / 1000.0
+        previous = None
+
+        while time.monotonic() < deadline:
+            frame = self._run(self.tool_executor.execute_action("screenshot", {}))
+            if frame == previous:
+                return frame
+            previous = frame
+            time.sleep(interval / 1000.0)
+
+        return previous
+
     def scroll_to(self, selector: str):
         """
         Scroll to element
@@ -416,7 +539,7 @@ Steps:
 """
 
         try:
-            asyncio.run(self.client.execute_task(
+            self._run(self.client.execute_task(
                 task_prompt=prompt,
                 max_iterations=10,
                 verbose=False
@@ -424,24 +547,24 @@ Steps:
         except Exception as e:
             print(f"   ⚠️  Scroll may not have completed: {e}")
 
-    def capture(
+    def _grab(
         self,
-        filename: str,
         selector: Optional[str] = None,
         full_page: bool = False
     ) -> str:
         """
-        Capture screenshot
+        Take the screenshot for a capture
 
         Args:
-            filename: Output filename (without extension)
             selector: CSS selector to capture specific element (optional)
             full_page: Capture full scrollable page (optional)
 
         Returns:
-            Path to saved screenshot
+            Base64-encoded PNG with data URI prefix
         """
-        print(f"📸 Capturing: {filename}")
+        if self.direct_navigation and not (selector or full_page):
+            # The viewport as it is needs no model turn: grab it directly
+            return self._run(self.tool_executor.execute_action("screenshot", {}))
 
         # Build prompt based on parameters
         if selector:
@@ -467,28 +590,131 @@ Otherwise, just take a single screenshot of the current viewport.
 Ensure the page is fully loaded and shows the content clearly.
 """
 
-        try:
-            result = asyncio.run(self.client.execute_task(
-                task_prompt=prompt,
-                max_iterations=10,
-                verbose=False
-            ))
+        result = self._run(self.client.execute_task(
+            task_prompt=prompt,
+            max_iterations=10,
+            verbose=False
+        ))
 
-            # Get the last screenshot from the result
-            screenshots = result.get('screenshots', [])
-            if not screenshots:
-                raise RuntimeError("No screenshot was captured")
+        # Get the last screenshot from the result
+        screenshots = result.get('screenshots', [])
+        if not screenshots:
+            raise RuntimeError("No screenshot was captured")
+        return screenshots[-1]
 
-            # Save screenshot
-            output_path = self._save_screenshot(screenshots[-1], filename)
-            print(f"   ✅ Saved: {output_path}")
+    def capture_async(
+        self,
+        filename: str,
+        selector: Optional[str] = None,
+        full_page: bool = False
+    ) -> Future:
+        """
+        Capture screenshot, saving the file on a background thread
 
-            return output_path
+        The screen is grabbed before returning, so the next step can start
+        while the PNG is decoded and written.
+
+        Args:
+            filename: Output filename (without extension)
+            selector: CSS selector to capture specific element (optional)
+            full_page: Capture full scrollable page (optional)
 
+        Returns:
+            Future resolving to the path of the saved screenshot
+        """
+        print(f"📸 Capturing: {filename}")
+
+        try:
+            screenshot = self._grab(selector, full_page)
         except Exception as e:
             print(f"   ❌ Capture error: {e}")
             raise RuntimeError(f"Screenshot capture failed: {e}")
 
+        def save():
+            try:
+                output_path = self._save_screenshot(screenshot, filename)
+            except Exception as e:
+                print(f"   ❌ Capture error: {e}")
+                raise RuntimeError(f"Screenshot capture failed: {e}")
+            print(f"   ✅ Saved: {output_path}")
+            return output_path
+
+        if self._writer is None:
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='screenshot-writer')
+        return self._writer.submit(save)
+
+    def capture(
+        self,
+        filename: str,
+        selector: Optional[str] = None,
+        full_page: bool = False
+    ) -> str:
+        """
+        Capture screenshot
+
+        Args:
+            filename: Output filename (without extension)
+            selector: CSS selector to capture specific element (optional)
+            full_page: Capture full scrollable page (optional)
+
+        Returns:
+            Path to saved screenshot
+        """
+        return self.capture_async(filename, selector, full_page).result()
+
+    def capture_steps(
+        self,
+        task_prompt: str,
+        checkpoints: List[str],
+        max_iterations: int = 40
+    ) -> Dict[str, str]:
+        """
+        Run a multi-step workflow in one agent session, capturing named states
+
+        One prompt scripts all the UI actions, so the system prompt and
+        screenshots are sent once instead of once per step. Each checkpoint's
+        screenshot is saved under the checkpoint name.
+
+        Args:
+            task_prompt: Numbered UI actions, saying where each checkpoint is reached
+            checkpoints: Checkpoint names, used as output filenames
+            max_iterations: Maximum agent loop iterations for the whole workflow
+
+        Returns:
+            Dict mapping each reached checkpoint to its saved screenshot path
+
+        Example:
+            capturer.capture_steps(
+                '''1. Fill the description field and click Next
+                2. Wait for step 2 (checkpoint wizard-step2)
+                3. Select "Today" and click Next (checkpoint wizard-step3)''',
+                checkpoints=['wizard-step2', 'wizard-step3']
+            )
+        """
+        print(f"🧭 Running {len(checkpoints)}-checkpoint workflow")
+
+        try:
+            result = self._run(self.client.execute_task(
+                task_prompt=task_prompt,
+                max_iterations=max_iterations,
+                verbose=False,
+                checkpoints=checkpoints
+            ))
+        except Exception as e:
+            print(f"   ❌ Workflow error: {e}")
+            raise RuntimeError(f"Workflow failed: {e}")
+
+        saved = {}
+        for name in checkpoints:
+            screenshot = result['checkpoints'].get(name)
+            if screenshot is None:
+                print(f"   ⚠️  Checkpoint not reached: {name}")
+                continue
+            saved[name] = self._save_screenshot(screenshot, name)
+            print(f"   ✅ Saved: {saved[name]}")
+
+        return saved
+
     def run_workflow(self, workflow: Callable):
         """
         Run custom workflow
@@ -506,7 +732,8 @@ Ensure the page is fully loaded and shows the content clearly.
         Save base64 screenshot to file
 
         Args:
-            base64_data: Base64-encoded PNG (with or without data URI)
+            base64_data: Base64-encoded image (with or without data URI;
+                without one it is assumed to be PNG)
             filename: Output filename (without extension)
 
         Returns:
@@ -515,22 +742,23 @@ Ensure the page is fully loaded and shows the content clearly.
         # Ensure output directory exists
         os.makedirs(self.output_dir, exist_ok=True)
 
-        # Add .png extension if not present
-        if not filename.endswith('.png'):
-            filename += '.png'
-
-        output_path = os.path.join(self.output_dir, filename)
-
-        # Remove data URI prefix if present
+        # Remove data URI prefix if present; it names the image format
+        extension = '.png'
         if base64_data.startswith("data:image"):
-            base64_data = base64_data.split(",")[1]
+            header, _, base64_data = base64_data.partition(",")
+            subtype = header[len("data:image/"):].split(";")[0]
+            extension = '.jpg' if subtype == 'jpeg' else f'.{subtype}'
+
+        # Add extension if not present
+        if not filename.endswith(extension):
+            filename += extension
 
-        # Decode and save
-        import base64
-        image_data = base64.b64decode(base64_data)
+        output_path = os.path.join(self.output_dir, filename)
 
-        with open(output_path, 'wb') as f:
-            f.write(image_data)
+        # The payload is already encoded, so write the decoded bytes as-is
+        # rather than round-tripping through PIL
+        if not write_if_changed(output_path, base64.b64decode(base64_data)):
+            print(f"   Unchanged since last capture: {filename}")
 
         return output_path
 
@@ -8,11 +8,25 @@ executing actions, and returning results.
 
 import anthropic
 import base64
+import hashlib
 import io
+import json
+import os
 import time
-from typing import Dict, List, Any, Optional
+import asyncio
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Union
 from PIL import Image
 
+from screenshot.checkpoints import checkpoint_instructions, find_checkpoints
+
+
+# Recorded action traces of completed tasks, keyed by prompt and starting screen
+TRACE_CACHE_DIR = Path.home() / '.cache' / 'max-doc-ai' / 'execute_task'
+
+# Screen polling interval while a replay waits for the UI to settle (seconds)
+REPLAY_POLL_INTERVAL = 0.25
+
 
 class ComputerUseClient:
     """
@@ -51,6 +65,9 @@ class ComputerUseClient:
         # Tool executor will be set by the capturer
         self.tool_executor = None
 
+        # Screenshot digest -> base64 string, so identical frames share one object
+        self._screenshot_intern: Dict[bytes, str] = {}
+
     def set_tool_executor(self, executor):
         """Set the tool executor instance"""
         self.tool_executor = executor
@@ -61,6 +78,7 @@ class ComputerUseClient:
         system_prompt: Optional[str] = None,
         max_iterations: int = 50,
         verbose: bool = True,
+        checkpoints: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """
         Execute a task using the agent loop
@@ -70,11 +88,19 @@ class ComputerUseClient:
             system_prompt: Optional system prompt with instructions/credentials
             max_iterations: Maximum agent loop iterations
             verbose: Print progress messages
+            checkpoints: Names of UI states to capture along the way; Claude
+                announces each one and its latest screenshot is kept
+
+        A task that completed before from an identical screen is replayed
+        from its recorded actions without calling Claude (set FORCE_LLM=1 to
+        always ask Claude). Tasks with a custom system prompt, such as login,
+        are never recorded, so credentials typed by Claude stay off disk.
 
         Returns:
             Dict containing:
                 - messages: Full conversation history
                 - screenshots: List of base64 screenshots captured
+                - checkpoints: Checkpoint name -> base64 screenshot, for those reached
                 - iterations: Number of iterations used
                 - success: Whether task completed successfully
 
@@ -85,18 +111,45 @@ class ComputerUseClient:
         if not self.tool_executor:
             raise RuntimeError("Tool executor not set. Call set_tool_executor() first.")
 
+        if checkpoints:
+            task_prompt += checkpoint_instructions(checkpoints)
+
         # Build initial messages
         messages = [
             {"role": "user", "content": task_prompt}
         ]
 
+        # Same task on the same starting screen: replay what worked last time
+        trace_path = None
+        if system_prompt is None and os.getenv('FORCE_LLM') != '1':
+            initial = await self.tool_executor.execute_action("screenshot", {})
+            trace_path = self._trace_path(task_prompt, initial)
+            replayed = await self._replay_trace(trace_path, verbose)
+            if replayed is True:
+                # An abandoned replay already acted, so the screen no longer
+                # matches the starting point the prompt assumes
+                messages[0]["content"] += (
+                    "\n\nNote: part of this task may already have been done. "
+                    "Take a screenshot first and continue from the current screen."
+                )
+            elif replayed is not None:
+                return replayed
+
         # Default system prompt if none provided
         if system_prompt is None:
             system_prompt = self._build_default_system_prompt()
 
         screenshots = []
+        reached = {}
         iterations = 0
 
+        # Actions and checkpoints in order, recorded for replay
+        trace = []
+        last_action_at = time.monotonic()
+
+        # Screenshot digests already sent in this conversation -> screenshot number
+        sent_screenshots: Dict[bytes, int] = {}
+
         while iterations < max_iterations:
             iterations += 1
 
@@ -137,20 +190,39 @@ class ComputerUseClient:
 
                     # Execute the tool action
                     try:
+                        # How long the UI had before this action (mostly model latency)
+                        delay = time.monotonic() - last_action_at
                         result = await self.tool_executor.execute_action(
                             action=action,
                             params=block.input
                         )
+                        last_action_at = time.monotonic()
+                        trace.append({"action": action, "params": block.input, "delay": round(delay, 2)})
+
+                        content = result if isinstance(result, (str, list)) else str(result)
 
                         # Store screenshots
-                        if action == "screenshot" and result:
+                        if action == "screenshot" and isinstance(result, str) and result:
+                            digest = hashlib.blake2b(result.encode(), digest_size=8).digest()
+                            result = self._intern_screenshot(digest, result)
                             screenshots.append(result)
 
+                            # Identical frame already in the conversation: send a
+                            # short reference instead of resending the image
+                            if digest in sent_screenshots:
+                                content = (
+                                    "Screen unchanged (identical to screenshot "
+                                    f"#{sent_screenshots[digest]})"
+                                )
+                            else:
+                                sent_screenshots[digest] = len(sent_screenshots) + 1
+                                content = result
+
                         # Format result for Claude
                         tool_results.append({
                             "type": "tool_result",
                             "tool_use_id": block.id,
-                            "content": result if isinstance(result, (str, list)) else str(result)
+                            "content": content
                         })
 
                     except Exception as e:
@@ -163,9 +235,17 @@ class ComputerUseClient:
                             "is_error": True
                         })
 
-                elif block.type == "text" and verbose:
+                elif block.type == "text":
+                    # A checkpoint refers to the latest screenshot
+                    if checkpoints and screenshots:
+                        for name in find_checkpoints(block.text, checkpoints):
+                            reached[name] = screenshots[-1]
+                            trace.append({"checkpoint": name, "digest": self._frame_digest(screenshots[-1])})
+                            if verbose:
+                                print(f"   📍 Checkpoint: {name}")
+
                     # Print Claude's thinking
-                    if block.text.strip():
+                    if verbose and block.text.strip():
                         print(f"   💭 Claude: {block.text[:100]}...")
 
             # If no tool use, task is complete
@@ -173,9 +253,13 @@ class ComputerUseClient:
                 if verbose:
                     print(f"   ✅ Task completed in {iterations} iterations")
 
+                if trace_path is not None:
+                    self._save_trace(trace_path, trace)
+
                 return {
                     "messages": messages,
                     "screenshots": screenshots,
+                    "checkpoints": reached,
                     "iterations": iterations,
                     "success": True
                 }
@@ -191,10 +275,141 @@ class ComputerUseClient:
         return {
             "messages": messages,
             "screenshots": screenshots,
+            "checkpoints": reached,
             "iterations": iterations,
             "success": False
         }
 
+    def _trace_path(self, task_prompt: str, initial_screenshot: str) -> Path:
+        """
+        Cache file for a task started from a given screen
+
+        Args:
+            task_prompt: Full task prompt
+            initial_screenshot: Base64 screenshot taken before the task
+
+        Returns:
+            Path of the recorded trace (may not exist)
+        """
+        screen = hashlib.sha256(initial_screenshot.encode()).digest()
+        key = hashlib.sha256(f"{self.model}:{task_prompt}".encode() + screen).hexdigest()
+        return TRACE_CACHE_DIR / f"{key}.json"
+
+    async def _replay_trace(self, path: Path, verbose: bool) -> Union[Dict[str, Any], bool, None]:
+        """
+        Re-run a recorded action trace without calling Claude
+
+        Before each action the screen is given up to the time it had while
+        recording to settle, since the recording waited on Claude between
+        actions. Each checkpoint frame must match the recorded one, otherwise
+        the UI has drifted and the replay is abandoned (and the trace deleted).
+
+        Args:
+            path: Trace file from _trace_path
+            verbose: Print progress messages
+
+        Returns:
+            Result dict as from execute_task; None if there is no usable
+            trace; True if the replay was abandoned after acting on the screen
+            (either way the agent loop then runs as usual)
+        """
+        try:
+            trace = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+
+        # Traces recorded before timing and checkpoint digests can't be verified
+        if any("delay" not in step and "digest" not in step for step in trace):
+            return None
+
+        if verbose:
+            print(f"   ♻️  Replaying {len(trace)} recorded steps")
+
+        screenshots = []
+        reached = {}
+        acted = False
+        try:
+            for step in trace:
+                if "checkpoint" in step:
+                    frame = screenshots[-1] if screenshots else None
+                    if frame is None or self._frame_digest(frame) != step["digest"]:
+                        raise RuntimeError(f"checkpoint {step['checkpoint']!r} doesn't match the recording")
+                    reached[step["checkpoint"]] = frame
+                    continue
+
+                if acted and step["delay"] > 0:
+                    await self._wait_for_settled_screen(step["delay"])
+
+                result = await self.tool_executor.execute_action(step["action"], step["params"])
+                if step["action"] == "screenshot":
+                    screenshots.append(result)
+                else:
+                    acted = True
+        except Exception as e:
+            print(f"   ⚠️  Replay abandoned ({e}); asking Claude instead")
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            return True if acted else None
+
+        return {
+            "messages": [],
+            "screenshots": screenshots,
+            "checkpoints": reached,
+            "iterations": 0,
+            "success": True
+        }
+
+    async def _wait_for_settled_screen(self, max_wait: float):
+        """Poll the screen until two consecutive frames match, for at most max_wait seconds"""
+        deadline = time.monotonic() + max_wait
+        previous = None
+        while time.monotonic() < deadline:
+            frame = await self.tool_executor.execute_action("screenshot", {})
+            if frame == previous:
+                return
+            previous = frame
+            await asyncio.sleep(REPLAY_POLL_INTERVAL)
+
+    @staticmethod
+    def _frame_digest(screenshot: str) -> str:
+        """Short digest identifying a screenshot in a trace"""
+        return hashlib.blake2b(screenshot.encode(), digest_size=16).hexdigest()
+
+    @staticmethod
+    def _save_trace(path: Path, trace: List[Dict[str, Any]]):
+        """Write a trace atomically; failing to cache is not an error"""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix('.tmp')
+            tmp_path.write_text(json.dumps(trace))
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+    def _intern_screenshot(self, digest: bytes, screenshot: str) -> str:
+        """
+        Return the shared string object for a screenshot
+
+        Args:
+            digest: Content hash of the screenshot
+            screenshot: Base64 screenshot string
+
+        Returns:
+            Previously interned string with the same content, or screenshot itself
+        """
+        interned = self._screenshot_intern.get(digest)
+        if interned is not None:
+            return interned
+
+        # Keep the table bounded; dicts preserve insertion order
+        if len(self._screenshot_intern) >= 32:
+            self._screenshot_intern.pop(next(iter(self._screenshot_intern)))
+
+        self._screenshot_intern[digest] = screenshot
+        return screenshot
+
     def _build_tool_config(self) -> List[Dict]:
         """Build Computer Use tool configuration"""
         return [{
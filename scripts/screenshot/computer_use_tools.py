@@ -23,6 +23,18 @@ except ImportError:
     PYAUTOGUI_AVAILABLE = False
     print("⚠️  Warning: pyautogui not available. Install with: pip install pyautogui")
 
+# zlib level for screenshot PNGs (0-9); 1 trades a slightly larger file for
+# several times faster encoding than PIL's default of 6
+PNG_COMPRESS_LEVEL = 1
+
+# Supported screenshot formats: name -> (PIL format, MIME subtype)
+IMAGE_FORMATS = {
+    'png': ('PNG', 'png'),
+    'jpg': ('JPEG', 'jpeg'),
+    'jpeg': ('JPEG', 'jpeg'),
+    'webp': ('WEBP', 'webp'),
+}
+
 
 class ComputerUseTool:
     """
@@ -32,16 +44,37 @@ class ComputerUseTool:
     the Computer Use API, such as taking screenshots, clicking, typing, etc.
     """
 
-    def __init__(self, display_width: int = 1280, display_height: int = 800):
+    def __init__(
+        self,
+        display_width: int = 1280,
+        display_height: int = 800,
+        image_format: str = 'png',
+        quality: int = 90
+    ):
         """
         Initialize tool executor
 
         Args:
             display_width: Target display width in pixels
             display_height: Target display height in pixels
+            image_format: Screenshot format: 'png', 'jpg' or 'webp' (default: png,
+                matching the screenshots.format config default; webp is roughly
+                a tenth of the PNG payload for the model to read, but lossy)
+            quality: JPEG/WebP quality (1-100)
+
+        Raises:
+            ValueError: If image_format is not supported
         """
+        if image_format.lower() not in IMAGE_FORMATS:
+            raise ValueError(
+                f"Unsupported screenshot format: {image_format}. "
+                f"Use one of: {', '.join(IMAGE_FORMATS)}"
+            )
+
         self.display_width = display_width
         self.display_height = display_height
+        self.image_format = image_format.lower()
+        self.quality = quality
 
         # Check if pyautogui is available
         if not PYAUTOGUI_AVAILABLE:
@@ -96,7 +129,7 @@ class ComputerUseTool:
             params: Empty dict (screenshot takes no parameters)
 
         Returns:
-            Base64-encoded PNG with data URI prefix
+            Base64-encoded image with data URI prefix
         """
         try:
             # Capture the screen
@@ -110,11 +143,17 @@ class ComputerUseTool:
                 )
 
             # Convert to base64
+            pil_format, subtype = IMAGE_FORMATS[self.image_format]
             buffer = io.BytesIO()
-            screenshot.save(buffer, format="PNG")
+            if pil_format == 'PNG':
+                screenshot.save(buffer, format='PNG', compress_level=PNG_COMPRESS_LEVEL)
+            elif pil_format == 'JPEG':
+                screenshot.convert('RGB').save(buffer, format='JPEG', quality=self.quality)
+            else:
+                screenshot.save(buffer, format='WEBP', quality=self.quality, method=4)
             base64_data = base64.b64encode(buffer.getvalue()).decode()
 
-            return f"data:image/png;base64,{base64_data}"
+            return f"data:image/{subtype};base64,{base64_data}"
 
         except Exception as e:
             raise RuntimeError(f"Screenshot capture failed: {e}")
@@ -12,10 +12,9 @@ If you don't have one, you'll need to mock screenshots or use placeholders.
 import sys
 from pathlib import Path
 
-# Add parent directory to path for imports
+# Add parent directory to path for imports. Config and the factory are
+# imported where they are used, so --help doesn't pay for loading them.
 sys.path.insert(0, str(Path(__file__).parent.parent))
-import config as cfg
-from screenshot.factory import create_capturer, create_capturer_from_plan
 
 
 def capture_flowstate_screenshots(base_url: str = None):
@@ -25,8 +24,11 @@ def capture_flowstate_screenshots(base_url: str = None):
     Args:
         base_url: Base URL for FlowState app (default: from config)
     """
+    from screenshot.factory import create_capturer_from_plan
+
     if base_url is None:
         try:
+            import config as cfg
             base_url = cfg.get_product_url()
         except:
             base_url = 'https://app.flowstate.example.com'
@@ -144,6 +146,8 @@ def capture_custom_workflow():
 
     This shows how to write a custom capture workflow for more complex scenarios.
     """
+    from screenshot.factory import create_capturer
+
     print("\n" + "=" * 60)
     print("📸 Custom Workflow Example")
     print("=" * 60 + "\n")
@@ -3,10 +3,21 @@ Screenshot Capturer Factory
 
 This module provides a factory function for creating screenshot capturers.
 Uses Claude's Computer Use API for intelligent, reliable screenshot capture.
+
+Capturers are handed out from a shared pool so that repeated or concurrent
+captures reuse an already started browser/session instead of launching
+(and authenticating) a new one every time.
 """
 
 import sys
+import queue
+import atexit
+import asyncio
+import threading
+from collections.abc import AsyncIterable, Sized
+from concurrent.futures import Future
 from pathlib import Path
+from typing import AsyncIterator, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -14,9 +25,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from screenshot.base import ScreenshotCapturerBase
 
 
-def create_capturer(provider: str = 'computer_use', **kwargs) -> ScreenshotCapturerBase:
+def build_capturer(provider: str = 'computer_use', **kwargs) -> ScreenshotCapturerBase:
     """
-    Factory function to create screenshot capturer
+    Construct a capturer directly, bypassing the pool (not started)
 
     Args:
         provider: 'computer_use' or 'playwright'
@@ -25,7 +36,7 @@ def create_capturer(provider: str = 'computer_use', **kwargs) -> ScreenshotCaptu
     if provider == 'playwright':
         from screenshot.capture import ScreenshotCapturer
         return ScreenshotCapturer(**kwargs)
-    
+
     try:
         from screenshot.computer_use_capture import ComputerUseScreenshotCapturer
         return ComputerUseScreenshotCapturer(**kwargs)
@@ -37,48 +48,544 @@ def create_capturer(provider: str = 'computer_use', **kwargs) -> ScreenshotCaptu
         )
 
 
-def create_capturer_from_plan(plan: list, base_url: str, provider: str = 'computer_use'):
+class BrowserPool:
     """
-    Create capturer and execute screenshot plan
+    Pool of started capturers, keyed by provider and constructor arguments
+
+    Playwright's sync API binds a browser to the thread that launched it, so
+    Playwright capturers are additionally keyed by thread. Computer Use
+    capturers hold no thread-bound state and are shared across threads.
+    """
+
+    def __init__(self, max_size: int = 4):
+        """
+        Initialize pool
+
+        Args:
+            max_size: Maximum idle capturers kept per key
+        """
+        self.max_size = max_size
+        self._idle: Dict[Tuple, List[ScreenshotCapturerBase]] = {}
+        self._launching: Dict[Tuple, Future] = {}
+        self._keys: Dict[int, Tuple] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(provider: str, kwargs: dict) -> Tuple:
+        """Build the pool key for a capturer configuration"""
+        key = (provider, repr(sorted(kwargs.items())))
+        if provider == 'playwright':
+            key += (threading.get_ident(),)
+        return key
+
+    def acquire(self, provider: str = 'computer_use', **kwargs) -> ScreenshotCapturerBase:
+        """
+        Get a started capturer, reusing an idle one when possible
+
+        Concurrent acquires for the same key wait for an in-flight launch
+        instead of starting a duplicate browser or login at the same time.
+
+        Args:
+            provider: 'computer_use' or 'playwright'
+            **kwargs: Additional arguments passed to capturer constructor
+
+        Returns:
+            Started capturer; hand it back with release()
+        """
+        key = self._key(provider, kwargs)
+
+        while True:
+            with self._lock:
+                idle = self._idle.get(key, [])
+                while idle:
+                    capturer = idle.pop()
+                    if capturer.is_alive():
+                        self._keys[id(capturer)] = key
+                        return capturer
+                    self._stop(capturer)
+
+                launch = self._launching.get(key)
+                if launch is None:
+                    launch = self._launching[key] = Future()
+                    break
+
+            # Another worker is starting one; wait for it, then check again
+            launch.exception()
+
+        try:
+            capturer = build_capturer(provider, **kwargs)
+            capturer.start()
+        except BaseException as e:
+            with self._lock:
+                del self._launching[key]
+            launch.set_exception(e)
+            raise
+
+        with self._lock:
+            del self._launching[key]
+            self._keys[id(capturer)] = key
+        launch.set_result(None)
+        return capturer
+
+    def release(self, capturer: ScreenshotCapturerBase, discard: bool = False):
+        """
+        Return a capturer to the pool
+
+        Args:
+            capturer: Capturer obtained from acquire()
+            discard: Stop the capturer instead of keeping it idle
+        """
+        with self._lock:
+            key = self._keys.pop(id(capturer), None)
+            if key is not None and not discard and capturer.is_alive():
+                idle = self._idle.setdefault(key, [])
+                if len(idle) < self.max_size:
+                    idle.append(capturer)
+                    return
+
+        self._stop(capturer)
+
+    def drain(self, provider: Optional[str] = None) -> int:
+        """
+        Stop idle capturers usable from the calling thread
+
+        Args:
+            provider: Only drain capturers of this provider (default: all)
+
+        Returns:
+            Number of capturers stopped
+        """
+        thread_id = threading.get_ident()
+        drained = []
+
+        with self._lock:
+            for key in list(self._idle):
+                if provider is not None and key[0] != provider:
+                    continue
+                if key[0] == 'playwright' and key[-1] != thread_id:
+                    continue
+                drained.extend(self._idle.pop(key))
+
+        for capturer in drained:
+            self._stop(capturer)
+
+        return len(drained)
+
+    @staticmethod
+    def _stop(capturer: ScreenshotCapturerBase):
+        """Stop a capturer, ignoring errors from already dead sessions"""
+        try:
+            capturer.stop()
+        except Exception as e:
+            print(f"   ⚠️  Could not stop capturer: {e}")
+
+
+_pool = BrowserPool()
+
+
+class PooledCapturer:
+    """Context manager that leases a started capturer from the shared pool"""
+
+    def __init__(self, provider: str, kwargs: dict):
+        self.provider = provider
+        self.kwargs = kwargs
+        self.capturer = None
+
+    def __enter__(self) -> ScreenshotCapturerBase:
+        self.capturer = _pool.acquire(self.provider, **self.kwargs)
+        return self.capturer
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        # A failed capture may leave the page in an unknown state
+        _pool.release(self.capturer, discard=exc_type is not None)
+        self.capturer = None
+
+
+def create_capturer(provider: str = 'computer_use', **kwargs) -> PooledCapturer:
+    """
+    Factory function to create screenshot capturer
+
+    Use as a context manager; the capturer is taken from a pool of started
+    instances on entry and returned to it on exit.
 
     Args:
-        plan: List of screenshot plan dicts
-        base_url: Base URL for the application
         provider: 'computer_use' or 'playwright'
+        **kwargs: Additional arguments passed to capturer constructor
+    """
+    return PooledCapturer(provider, kwargs)
+
+
+def drain_pool(provider: Optional[str] = None) -> int:
+    """
+    Stop idle pooled capturers (call on shutdown)
+
+    Args:
+        provider: Only drain capturers of this provider (default: all)
+
+    Returns:
+        Number of capturers stopped
+    """
+    return _pool.drain(provider)
+
+
+atexit.register(drain_pool)
+
+
+class PlanItem(NamedTuple):
+    """A validated screenshot plan entry"""
+
+    name: str
+    url: str = ''
+    wait_for: Optional[str] = None
+    wait_time: Optional[int] = None
+    selector: Optional[str] = None
+    scroll_to: Optional[str] = None
+    full_page: bool = False
+
+    @classmethod
+    def from_dict(cls, item: dict) -> 'PlanItem':
+        """
+        Build a plan item from a plan dict
+
+        Unknown keys (e.g. 'description') are ignored.
+
+        Raises:
+            ValueError: If the item has no name
+        """
+        if not item.get('name'):
+            raise ValueError(f"Screenshot plan item is missing 'name': {item}")
+        return cls(**{key: item[key] for key in cls._fields if key in item})
+
+
+def _default_concurrency(count: int, limit: int = 5) -> int:
+    """
+    Pick a worker count for a plan of the given size
+
+    Grows with log2(count): page loads are I/O-bound, so a handful of
+    pages already hides most of the latency without thrashing the machine.
+    """
+    return max(1, min(limit, count.bit_length()))
+
+
+async def _group_by_url(
+    plan: Union[Iterable[dict], AsyncIterable]
+) -> AsyncIterator[List[Tuple[int, dict]]]:
+    """
+    Yield runs of consecutive plan items that target the same URL
+
+    Works on lists, generators and async iterators alike, so a plan can be
+    captured while it is still being produced. Dicts are converted to
+    PlanItem as they arrive.
+
+    Yields:
+        Lists of (plan index, PlanItem) tuples
+    """
+    if not isinstance(plan, AsyncIterable):
+        plan = _aiter(plan)
+
+    group = []
+    index = 0
+    async for item in plan:
+        if not isinstance(item, PlanItem):
+            item = PlanItem.from_dict(item)
+        if group and item.url != group[-1][1].url:
+            yield group
+            group = []
+        group.append((index, item))
+        index += 1
+
+    if group:
+        yield group
+
+
+async def _aiter(items: Iterable[dict]) -> AsyncIterator[dict]:
+    """Adapt a plain iterable to an async iterator"""
+    for item in items:
+        yield item
+
+
+def _capture_item(
+    capturer: ScreenshotCapturerBase,
+    item: PlanItem,
+    base_url: str,
+    loaded: Optional[PlanItem] = None
+) -> Future:
+    """
+    Run navigate → wait → scroll → capture for a single plan item
+
+    Args:
+        capturer: Started capturer instance
+        item: Screenshot plan item
+        base_url: Base URL for the application
+        loaded: Previous item whose page is still showing at the same URL;
+            navigation, the fixed wait and a repeated selector wait are skipped
+
+    Returns:
+        Future resolving to the path of the saved screenshot
     """
-    with create_capturer(provider=provider) as capturer:
-        for item in plan:
-            name = item['name']
-            url = base_url + item.get('url', '')
+    name, url, wait_for, wait_time, selector, scroll_to, full_page = item
+
+    if loaded is None:
+        # Navigate
+        capturer.navigate(base_url + url)
+
+    # Wait for specific element if specified. The selector is the readiness
+    # signal, so wait_time is not slept on top of it but bounds the wait.
+    if wait_for is not None:
+        if loaded is None or wait_for != loaded.wait_for:
+            if wait_time is not None:
+                capturer.wait_for_selector(wait_for, timeout=wait_time)
+            else:
+                capturer.wait_for_selector(wait_for)
+
+    # Without a selector, wait_time is an upper bound for the page to settle
+    elif wait_time is not None and loaded is None:
+        capturer.wait_until_stable(wait_time)
+
+    # Scroll to element if specified
+    if scroll_to is not None:
+        capturer.scroll_to(scroll_to)
 
-            # Navigate
-            capturer.navigate(url)
+    # Capture
+    return capturer.capture_async(
+        filename=name,
+        selector=selector,
+        full_page=full_page
+    )
+
+
+def _capture_group(capturer: ScreenshotCapturerBase, group: list, base_url: str) -> list:
+    """
+    Capture a group of same-URL items, navigating only once
+
+    The page is reloaded only when the previous item scrolled it or failed.
+    Each screenshot is saved while the next item is being prepared.
+
+    Args:
+        capturer: Started capturer instance
+        group: List of (plan index, item) tuples sharing a URL
+        base_url: Base URL for the application
+
+    Returns:
+        List of (plan index, item, saved path or exception) tuples
+    """
+    pending = []
+    loaded = None
 
-            # Wait for specific element if specified
-            if 'wait_for' in item:
-                capturer.wait_for_selector(item['wait_for'])
+    for index, item in group:
+        try:
+            pending.append((index, item, _capture_item(capturer, item, base_url, loaded)))
+            loaded = None if item.scroll_to is not None else item
+        except Exception as e:
+            pending.append((index, item, e))
+            loaded = None
 
-            # Additional wait time
-            if 'wait_time' in item:
-                capturer.wait(item['wait_time'])
+    results = []
+    for index, item, outcome in pending:
+        if isinstance(outcome, Future):
+            try:
+                outcome = outcome.result()
+            except Exception as e:
+                outcome = e
+        results.append((index, item, outcome))
+
+    return results
+
+
+async def _dispatch(groups: AsyncIterator[list], run_group, concurrency: int) -> list:
+    """
+    Run groups as they arrive with at most concurrency in flight
+
+    Args:
+        groups: Async iterator of lists of (plan index, PlanItem) tuples
+        run_group: Coroutine function taking a group and returning
+            (index, item, result-or-exception) tuples
+        concurrency: Maximum groups in flight
+
+    Returns:
+        List of (PlanItem, saved path or raised exception) tuples, in plan order
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def dispatch(group):
+        try:
+            return await run_group(group)
+        except Exception as e:
+            return [(index, item, e) for index, item in group]
+        finally:
+            semaphore.release()
+
+    tasks = []
+    try:
+        async for group in groups:
+            await semaphore.acquire()
+            tasks.append(asyncio.create_task(dispatch(group)))
+    except BaseException:
+        # The plan stream failed (e.g. an invalid item): stop the groups
+        # already running and collect them before re-raising
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+    results = []
+    for finished in asyncio.as_completed(tasks):
+        results.extend(await finished)
+
+    results.sort(key=lambda entry: entry[0])
+    return [(item, result) for _, item, result in results]
+
+
+async def _one_per_group(groups: AsyncIterator[list]) -> AsyncIterator[list]:
+    """Split URL groups back into single-item groups"""
+    async for group in groups:
+        for entry in group:
+            yield [entry]
+
+
+async def _capture_plan_on_pages(plan, base_url: str, concurrency: int) -> list:
+    """
+    Capture a plan on concurrent pages of one warm Playwright browser
 
-            # Scroll to element if specified
-            if 'scroll_to' in item:
-                capturer.scroll_to(item['scroll_to'])
+    Every item gets its own page in a shared context, so pages for the same
+    URL load from a warm cache and no item waits on a browser launch.
+    """
+    from screenshot.capture import AsyncBrowserSession
 
-            # Capture
-            capturer.capture(
-                filename=name,
-                selector=item.get('selector'),
-                full_page=item.get('full_page', False)
+    async with AsyncBrowserSession() as session:
+        async def run_page(group):
+            [(index, item)] = group
+            path = await session.capture_one(
+                base_url + item.url,
+                item.name,
+                wait_for=item.wait_for,
+                wait_time=item.wait_time,
+                selector=item.selector,
+                scroll_to=item.scroll_to,
+                full_page=item.full_page
             )
+            return [(index, item, path)]
+
+        return await _dispatch(_one_per_group(_group_by_url(plan)), run_page, concurrency)
+
+
+async def _capture_plan_on_thread(plan, base_url: str, provider: str) -> list:
+    """
+    Capture a plan group by group with a pooled capturer on a worker thread
+
+    Keeps the blocking capturer off the event loop, so plan generation
+    still overlaps with capture.
+    """
+    loop = asyncio.get_running_loop()
+    work = queue.Queue()
+
+    def worker():
+        while True:
+            job = work.get()
+            if job is None:
+                break
+
+            group, future = job
+            try:
+                with create_capturer(provider=provider) as capturer:
+                    result = _capture_group(capturer, group, base_url)
+            except Exception as e:
+                # Could not get a capturer; the whole group failed
+                result = [(index, item, e) for index, item in group]
+            loop.call_soon_threadsafe(future.set_result, result)
+
+    thread = threading.Thread(target=worker, name='capture', daemon=True)
+    thread.start()
+
+    async def run_group(group):
+        future = loop.create_future()
+        work.put((group, future))
+        return await future
+
+    try:
+        return await _dispatch(_group_by_url(plan), run_group, 1)
+    finally:
+        work.put(None)
+        await loop.run_in_executor(None, thread.join)
+
+
+async def async_capture_plan(
+    plan: Union[Iterable[dict], AsyncIterable],
+    base_url: str,
+    provider: str = 'playwright',
+    concurrency: int = None
+) -> list:
+    """
+    Capture a screenshot plan with several items in flight at once
+
+    The plan may be a list, a generator or an async iterator; items are
+    dispatched as they arrive, so capture overlaps with plan generation.
+    Playwright captures each item on its own page of one shared browser,
+    bounded by a semaphore. Computer Use drives the one physical desktop, so
+    its items run one URL group at a time, with a single navigation per
+    group of consecutive items sharing a URL.
+
+    Args:
+        plan: Screenshot plan dicts
+        base_url: Base URL for the application
+        provider: 'computer_use' or 'playwright'
+        concurrency: Maximum pages in flight (default: log2 of plan size, max 5)
+
+    Returns:
+        List of (PlanItem, saved path or raised exception) tuples, in plan order
+
+    Raises:
+        ValueError: If a plan item is invalid
+    """
+    if isinstance(plan, Sized) and not isinstance(plan, AsyncIterable):
+        # Whole plan is already in memory: validate it before launching anything
+        plan = [PlanItem.from_dict(item) for item in plan]
+
+    if provider != 'playwright':
+        return await _capture_plan_on_thread(plan, base_url, provider)
+
+    if concurrency is None:
+        concurrency = _default_concurrency(len(plan)) if isinstance(plan, Sized) else 5
+    return await _capture_plan_on_pages(plan, base_url, max(1, concurrency))
+
+
+def create_capturer_from_plan(
+    plan: Union[Iterable[dict], AsyncIterable],
+    base_url: str,
+    provider: str = 'computer_use'
+):
+    """
+    Create capturer and execute screenshot plan
+
+    Args:
+        plan: Screenshot plan dicts (list, generator or async iterator)
+        base_url: Base URL for the application
+        provider: 'computer_use' or 'playwright'
+    """
+    results = asyncio.run(async_capture_plan(plan, base_url, provider=provider))
+
+    failures = [
+        (item.name, result)
+        for item, result in results
+        if isinstance(result, BaseException)
+    ]
+    for name, error in failures:
+        print(f"   ❌ {name}: {error}")
+
+    print(f"\n✅ Captured {len(results) - len(failures)} screenshots")
 
-    print(f"\n✅ Captured {len(plan)} screenshots")
+    if failures:
+        raise RuntimeError(f"{len(failures)} of {len(results)} screenshots failed")
 
 
 # Export main functions
 __all__ = [
     'create_capturer',
+    'build_capturer',
     'create_capturer_from_plan',
+    'async_capture_plan',
+    'drain_pool',
+    'BrowserPool',
+    'PlanItem',
     'ScreenshotCapturerBase',
 ]
@@ -10,11 +10,53 @@ import time
 import base64
 import io
 import asyncio
+import hashlib
+import functools
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
 from typing import Dict, List, Any, Optional
-from PIL import Image
-import google.generativeai as genai
-from google.generativeai.types import content_types
-from google.protobuf import struct_pb2
+
+from screenshot.checkpoints import checkpoint_instructions, find_checkpoints
+
+@functools.lru_cache(maxsize=None)
+def _get_genai():
+    """Import google.generativeai on first use (it is slow to import)"""
+    import google.generativeai as genai
+    return genai
+
+
+def _proto_to_py(value: Any) -> Any:
+    """
+    Convert proto-plus containers to plain Python in a single pass
+
+    Function call args arrive as MapComposite/RepeatedComposite views over
+    the underlying protobuf Struct; this turns them into dicts and lists.
+    """
+    if isinstance(value, Mapping):
+        return {key: _proto_to_py(item) for key, item in value.items()}
+    if isinstance(value, Sequence) and not isinstance(value, (str, bytes)):
+        return [_proto_to_py(item) for item in value]
+    return value
+
+
+# Number of prepared screenshots kept per client
+IMAGE_CACHE_SIZE = 8
+
+# (API key, event loop) genai is currently configured for. genai keeps one
+# async gRPC (HTTP/2) channel per process, bound to the event loop that first
+# used it, and configure() throws it away. Reconfigure only when the key or
+# the running loop changes: clients on the same loop share the connection,
+# and a new loop (another asyncio.run, a replacement capturer) gets its own.
+_configured_for = None
+
+
+def _configure_genai(api_key: str, loop: Optional[asyncio.AbstractEventLoop] = None):
+    """Configure genai once per API key and event loop"""
+    global _configured_for
+    if (api_key, loop) != _configured_for:
+        _get_genai().configure(api_key=api_key)
+        _configured_for = (api_key, loop)
+
 
 class GeminiComputerUseClient:
     """
@@ -31,11 +73,20 @@ class GeminiComputerUseClient:
         """
         Initialize Gemini client
         """
-        genai.configure(api_key=api_key)
+        _configure_genai(api_key)
+        self.api_key = api_key
         self.model_name = model
         self.display_width = display_width
         self.display_height = display_height
         self.tool_executor = None
+
+        # Event loop the model's async client belongs to (see _bind_loop)
+        self._loop = None
+
+        # Screenshot content hash -> prepared JPEG part (LRU)
+        self._image_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        self._image_cache_hits = 0
+        self._image_cache_lookups = 0
         
         # Initialize the model with tools
         # We map the "computer" tool actions to a single function for simplicity
@@ -87,28 +138,139 @@ class GeminiComputerUseClient:
             }
         ]
         
-        self.model = genai.GenerativeModel(
+        self.model = self._build_model()
+
+    def _build_model(self):
+        """Create the GenerativeModel with the computer tool"""
+        return _get_genai().GenerativeModel(
             model_name=self.model_name,
             tools=self.tools_def
         )
 
+    def _bind_loop(self):
+        """
+        Make sure the model's async client belongs to the running event loop
+
+        The model keeps the async client it first used, and that client's
+        channel only works on the loop it was created on. When called from a
+        different loop, configure genai for it and start from a fresh model.
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            _configure_genai(self.api_key, loop)
+            self.model = self._build_model()
+            self._loop = loop
+
     def set_tool_executor(self, executor):
         """Set the tool executor instance"""
         self.tool_executor = executor
 
+    async def preconnect(self) -> bool:
+        """
+        Open the async connection to the Gemini API ahead of the first task
+
+        genai shares one async gRPC (HTTP/2) channel per process, bound to
+        the event loop that created it. A token count is free and opens that
+        channel, so the first agent turn doesn't pay for the TLS handshake.
+        Only helps tasks that later run on the same loop.
+
+        Returns:
+            True if the API was reachable
+        """
+        self._bind_loop()
+        try:
+            await self.model.count_tokens_async("ping")
+            return True
+        except Exception:
+            return False
+
+    def _prepare_image(self, b64_data: str) -> Dict[str, Any]:
+        """
+        Convert a base64 screenshot into a compact image part for Gemini
+
+        The image is downscaled to the display size and re-encoded as JPEG,
+        which is far smaller on the wire than the original PNG. Results are
+        cached by content hash, so repeated frames are only processed once.
+        """
+        if b64_data.startswith("data:"):
+            b64_data = b64_data.split(",", 1)[1]
+
+        key = hashlib.blake2b(b64_data.encode(), digest_size=16).digest()
+        self._image_cache_lookups += 1
+        part = self._image_cache.get(key)
+        if part is not None:
+            self._image_cache_hits += 1
+            self._image_cache.move_to_end(key)
+            return part
+
+        from PIL import Image
+
+        # BytesIO over the decoded bytes shares them instead of copying
+        img = Image.open(io.BytesIO(base64.b64decode(b64_data)))
+        # Bilinear is plenty for model vision input and much cheaper than Lanczos
+        img.thumbnail((self.display_width, self.display_height), Image.Resampling.BILINEAR)
+
+        out = io.BytesIO()
+        img.convert("RGB").save(out, format="JPEG", quality=75)
+        part = {"mime_type": "image/jpeg", "data": out.getvalue()}
+
+        self._image_cache[key] = part
+        if len(self._image_cache) > IMAGE_CACHE_SIZE:
+            self._image_cache.popitem(last=False)
+
+        return part
+
+    async def _tool_worker(self, queue: asyncio.Queue):
+        """
+        Execute queued tool actions one at a time, in submission order
+
+        There is only one desktop, so actions must not interleave. Futures
+        cancelled before their turn (e.g. an unneeded speculative screenshot)
+        are skipped without touching the screen.
+        """
+        while True:
+            action, args, future = await queue.get()
+            try:
+                if not future.cancelled():
+                    result = await self.tool_executor.execute_action(action, args)
+                    if not future.cancelled():
+                        future.set_result(result)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if not future.cancelled():
+                    future.set_exception(e)
+            finally:
+                queue.task_done()
+
+    @staticmethod
+    def _submit_action(queue: asyncio.Queue, action: str, args: Dict[str, Any]) -> asyncio.Future:
+        """Queue a tool action for the worker and return its pending result"""
+        future = asyncio.get_running_loop().create_future()
+        queue.put_nowait((action, args, future))
+        return future
+
     async def execute_task(
         self,
         task_prompt: str,
         system_prompt: Optional[str] = None,
         max_iterations: int = 50,
         verbose: bool = True,
+        checkpoints: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """
         Execute a task using the agent loop
+
+        checkpoints names UI states to capture along the way; the result's
+        "checkpoints" maps each one reached to its screenshot.
         """
         if not self.tool_executor:
             raise RuntimeError("Tool executor not set.")
 
+        if checkpoints:
+            task_prompt += checkpoint_instructions(checkpoints)
+
+        self._bind_loop()
         chat = self.model.start_chat(history=[])
         
         # Initial prompt including system instructions as the first user message context
@@ -122,87 +284,99 @@ ALWAYS take a screenshot after an action to verify the result.
 Stop when the task is complete.
 """
         
-        messages = [] # Keep local history for return value
-        screenshots = []
-        iterations = 0
-        success = False
+        # Tool calls go through a queue so the desktop is driven by a single
+        # consumer while the loop keeps talking to the model
+        tool_queue = asyncio.Queue()
+        worker = asyncio.create_task(self._tool_worker(tool_queue))
+
+        try:
+            messages = [] # Keep local history for return value
+            screenshots = []
+            reached = {}
+            iterations = 0
+            success = False
         
-        current_input = full_prompt
+            current_input = full_prompt
+
+            # Last image attached to the conversation; identical frames map to the
+            # same cached part, so an identity check detects an unchanged screen
+            shown_image = None
         
-        # Take an initial screenshot to give context
-        try:
-            initial_screen_b64 = await self.tool_executor.execute_action("screenshot", {})
-            # Remove data prefix
-            if initial_screen_b64.startswith("data:"):
-                initial_screen_b64 = initial_screen_b64.split(",")[1]
+            # Take an initial screenshot to give context
+            try:
+                initial_screen_b64 = await self.tool_executor.execute_action("screenshot", {})
+                # Remove data prefix
+                if initial_screen_b64.startswith("data:"):
+                    initial_screen_b64 = initial_screen_b64.split(",")[1]
             
-            initial_image = Image.open(io.BytesIO(base64.b64decode(initial_screen_b64)))
-            current_parts = [current_input, initial_image]
-            screenshots.append(initial_screen_b64) # Store simplified
-        except Exception as e:
-            if verbose: print(f"Warning: Initial screenshot failed: {e}")
-            current_parts = [current_input]
-
-        while iterations < max_iterations:
-            iterations += 1
-            if verbose:
-                print(f"   🔄 Gemini Agent loop iteration {iterations}/{max_iterations}")
+                initial_image = self._prepare_image(initial_screen_b64)
+                current_parts = [current_input, initial_image]
+                shown_image = initial_image
+                screenshots.append(initial_screen_b64) # Store simplified
+            except Exception as e:
+                if verbose: print(f"Warning: Initial screenshot failed: {e}")
+                current_parts = [current_input]
+
+            while iterations < max_iterations:
+                iterations += 1
+                if verbose:
+                    print(f"   🔄 Gemini Agent loop iteration {iterations}/{max_iterations}")
 
-            try:
-                response = chat.send_message(current_parts)
-                # Handle responses that are purely function calls (no text)
                 try:
-                    text_content = response.text
-                except ValueError:
-                    text_content = "" # Function call only
+                    response = await chat.send_message_async(current_parts)
+                    # Handle responses that are purely function calls (no text)
+                    try:
+                        text_content = response.text
+                    except ValueError:
+                        text_content = "" # Function call only
                 
-                messages.append({"role": "model", "content": text_content})
-            except Exception as e:
-                print(f"   ❌ API error: {e}")
-                raise
+                    messages.append({"role": "model", "content": text_content})
+                except Exception as e:
+                    print(f"   ❌ API error: {e}")
+                    raise
 
-            # Process function calls
-            function_calls = []
-            for part in response.parts:
-                if fn := part.function_call:
-                    function_calls.append(fn)
+                # A checkpoint refers to the latest screenshot
+                if checkpoints and screenshots:
+                    for name in find_checkpoints(text_content, checkpoints):
+                        reached[name] = screenshots[-1]
+                        if verbose: print(f"   📍 Checkpoint: {name}")
 
-            if not function_calls:
-                # No tool use, assume task completion or question
-                if verbose:
-                     print(f"   💭 Gemini: {response.text}")
-                     print(f"   ✅ Task likely completed (no tool use)")
-                success = True # Assume success if it stops calling tools
-                break
-
-            # Execute tools
-            tool_outputs = []
-            has_screenshot = False
+                # Process function calls
+                function_calls = []
+                for part in response.parts:
+                    if fn := part.function_call:
+                        function_calls.append(fn)
+
+                if not function_calls:
+                    # No tool use, assume task completion or question
+                    if verbose:
+                         print(f"   💭 Gemini: {response.text}")
+                         print(f"   ✅ Task likely completed (no tool use)")
+                    success = True # Assume success if it stops calling tools
+                    break
+
+                # Execute tools
+                tool_outputs = []
+                last_image = None
             
-            for fc in function_calls:
-                if fc.name == "perform_action":
-                    args = dict(fc.args)
-                    action = args.get("action")
-                    if verbose: print(f"   🔧 Tool: {action} {args}")
-                    
+                # Queue every call up front; the worker runs them in order
+                # while results are collected below
+                queued = []
+                for fc in function_calls:
+                    if fc.name == "perform_action":
+                        args = _proto_to_py(fc.args)
+                        action = args.get("action")
+                        if verbose: print(f"   🔧 Tool: {action} {args}")
+                        queued.append((action, self._submit_action(tool_queue, action, args)))
+
+                for action, pending in queued:
                     try:
-                        # Clean args for tool executor (it expects specific keys)
-                        # coordinate is repeated by protobuf to list
-                        if 'coordinate' in args:
-                            args['coordinate'] = list(args['coordinate'])
-                            
-                        result = await self.tool_executor.execute_action(action, args)
-                        
+                        result = await pending
+                    
                         # Handle screenshot result (special handling for Gemini vision)
                         if action == "screenshot":
-                            has_screenshot = True
-                            if result.startswith("data:"):
-                                b64_data = result.split(",")[1]
-                            else:
-                                b64_data = result
-                            
-                            img = Image.open(io.BytesIO(base64.b64decode(b64_data)))
-                            # We send the image object to Gemini
+                            # Decode once; the same image is attached to the next turn
+                            last_image = self._prepare_image(result)
                             tool_outputs.append({
                                 "function_response": {
                                     "name": "perform_action",
@@ -213,7 +387,7 @@ Stop when the task is complete.
                             # But wait, send_message_response needs to match function_calls
                             # We can't easily mix text/images in function_response in simple chat?
                             # Actually with send_message we provide a list of parts.
-                            
+                        
                             screenshots.append(result)
                         else:
                             tool_outputs.append({
@@ -232,54 +406,78 @@ Stop when the task is complete.
                             }
                         })
 
-            # Prepare next input
-            # If we had function calls, we must send function responses
-            # For the screenshot, we want to provide the visual context.
+                # Prepare next input
+                # If we had function calls, we must send function responses
+                # For the screenshot, we want to provide the visual context.
             
-            # Construct the response parts
-            response_parts = []
-            for output in tool_outputs:
-                response_parts.append(output)
+                # Construct the response parts
+                response_parts = []
+                for output in tool_outputs:
+                    response_parts.append(output)
             
-            # If we took a screenshot, we should append it to the context, 
-            # but in the chat.send_message flow with function calling, 
-            # we typically respond with the function output.
-            # To get the vision capability, we might need to send a follow-up 
-            # user message "Here is the screen now: [Image]"?
-            # Or can we include the image in the function response? 
-            # Gemini documentation says function response is JSON.
+                # If we took a screenshot, we should append it to the context, 
+                # but in the chat.send_message flow with function calling, 
+                # we typically respond with the function output.
+                # To get the vision capability, we might need to send a follow-up 
+                # user message "Here is the screen now: [Image]"?
+                # Or can we include the image in the function response? 
+                # Gemini documentation says function response is JSON.
             
-            # Strategy: Send function responses using the chat object (which handles history).
-            # Then, if there was a screenshot, send a new USER message with the image.
+                # Strategy: Send function responses using the chat object (which handles history).
+                # Then, if there was a screenshot, send a new USER message with the image.
             
-            # WAIT: chat.send_message accepts 'parts'.
-            # We must reply to the function call first.
-            try:
-                chat.send_message(response_parts)
-                # messages.append({"role": "function", "content": ...}) 
-            except Exception as e:
-                 print(f"   ❌ Error sending function response: {e}")
-                 raise
-
-            # Now, if we have a new state (screenshot), we need to show it to the model
-            # for the NEXT turn.
-            if has_screenshot:
-                # We need to grab the last screenshot captured
-                last_shot_b64 = screenshots[-1]
-                if last_shot_b64.startswith("data:"):
-                    last_shot_b64 = last_shot_b64.split(",")[1]
-                img = Image.open(io.BytesIO(base64.b64decode(last_shot_b64)))
-                
-                # We manually trigger the next turn with the image
-                current_parts = ["Here is the screen after the action:", img]
-            else:
-                # Just prompt to continue
-                current_parts = ["Action completed. Ensure you verify the result. What is the next step?"]
+                # WAIT: chat.send_message accepts 'parts'.
+                # We must reply to the function call first.
+                # If the model didn't ask for a screenshot, grab one while the
+                # function responses are in flight so it can verify the action.
+                pending_screenshot = None
+                if last_image is None:
+                    pending_screenshot = self._submit_action(tool_queue, "screenshot", {})
+
+                try:
+                    await chat.send_message_async(response_parts)
+                    # messages.append({"role": "function", "content": ...}) 
+                except Exception as e:
+                     if pending_screenshot:
+                         pending_screenshot.cancel()
+                     print(f"   ❌ Error sending function response: {e}")
+                     raise
+
+                if pending_screenshot:
+                    try:
+                        result = await pending_screenshot
+                        last_image = self._prepare_image(result)
+                        screenshots.append(result)
+                    except Exception as e:
+                        if verbose: print(f"   ⚠️  Follow-up screenshot failed: {e}")
+
+                # Now, if we have a new state (screenshot), we need to show it to the model
+                # for the NEXT turn.
+                if last_image is not None and last_image is shown_image:
+                    # Same frame the model already has; don't resend the image
+                    current_parts = ["Screen unchanged; proceeding."]
+                elif last_image is not None:
+                    # We manually trigger the next turn with the image
+                    current_parts = ["Here is the screen after the action:", last_image]
+                    shown_image = last_image
+                else:
+                    # Just prompt to continue
+                    current_parts = ["Action completed. Ensure you verify the result. What is the next step?"]
+
+            if verbose and self._image_cache_lookups:
+                print(
+                    f"   🗂️  Screenshot cache: {self._image_cache_hits}/"
+                    f"{self._image_cache_lookups} hits"
+                )
             
-        return {
-            "messages": messages,
-            "screenshots": screenshots,
-            "iterations": iterations,
-            "success": success
-        }
+            return {
+                "messages": messages,
+                "screenshots": screenshots,
+                "checkpoints": reached,
+                "iterations": iterations,
+                "success": success
+            }
+        finally:
+            worker.cancel()
+            await asyncio.gather(worker, return_exceptions=True)
 
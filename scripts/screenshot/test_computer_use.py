@@ -8,8 +8,15 @@ This tests all components: dependencies, configuration, API connectivity, and sc
 
 import sys
 import os
+import json
+import time
+import hashlib
 from pathlib import Path
 import asyncio
+import inspect
+import contextlib
+import contextvars
+import importlib.util
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -17,30 +24,76 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 # Test results tracking
 test_results = []
 
+# Successful API probes are remembered for an hour so repeat runs skip the call
+API_PROBE_CACHE = Path.home() / '.cache' / 'max-doc-ai' / 'api_probe.json'
+API_PROBE_TTL = 3600
+
+# Output of each finished test, keyed by test name
+test_output = {}
+
+# Detail lines of the test running in the current context. Tests run
+# concurrently, so their output is collected and printed as one block.
+_details = contextvars.ContextVar('details', default=None)
+
+
+def detail(line):
+    """Record a detail line for the running test (printed with its result)"""
+    lines = _details.get()
+    if lines is None:
+        print(line)
+    else:
+        lines.append(line)
+
+
+@contextlib.contextmanager
+def record(name):
+    """
+    Record the outcome of the test run inside the block
+
+    An exception marks the test as failed and is not propagated. Detail
+    lines and the result line are collected into test_output[name].
+    """
+    lines = []
+    token = _details.set(lines)
+    try:
+        yield
+        test_results.append((name, True, None))
+        lines.append(f"✅ {name}")
+    except Exception as e:
+        test_results.append((name, False, str(e)))
+        lines.append(f"❌ {name}")
+        lines.append(f"   Error: {e}")
+    finally:
+        _details.reset(token)
+        test_output[name] = "\n".join(lines)
+
 
 def test(name):
-    """Decorator to track test results"""
+    """
+    Decorator to track test results
+
+    The wrapped test becomes a coroutine; plain (blocking) test functions
+    are run in a worker thread so they don't stall the other tests.
+    """
     def decorator(func):
-        def wrapper(*args, **kwargs):
-            try:
-                result = func(*args, **kwargs)
-                test_results.append((name, True, None))
-                print(f"✅ {name}")
-                return result
-            except Exception as e:
-                test_results.append((name, False, str(e)))
-                print(f"❌ {name}")
-                print(f"   Error: {e}")
-                return None
+        async def wrapper(*args, **kwargs):
+            with record(name):
+                if inspect.iscoroutinefunction(func):
+                    return await func(*args, **kwargs)
+                return await asyncio.to_thread(func, *args, **kwargs)
+        wrapper.test_name = name
         return wrapper
     return decorator
 
 
+def format_header(title):
+    """Format section header"""
+    return f"\n{'='*60}\n  {title}\n{'='*60}\n"
+
+
 def print_header(title):
     """Print section header"""
-    print(f"\n{'='*60}")
-    print(f"  {title}")
-    print(f"{'='*60}\n")
+    print(format_header(title))
 
 
 @test("Dependencies installed")
@@ -54,12 +107,12 @@ def test_dependencies():
         'aiohttp'
     ]
 
-    missing = []
-    for module in required_modules:
-        try:
-            __import__(module)
-        except ImportError:
-            missing.append(module)
+    # Only check that each module can be found; importing them all just to
+    # test presence would run their (slow) top-level code
+    missing = [
+        module for module in required_modules
+        if importlib.util.find_spec(module) is None
+    ]
 
     if missing:
         raise RuntimeError(f"Missing modules: {', '.join(missing)}")
@@ -89,17 +142,15 @@ def test_configuration():
         if not cu_config:
             raise ValueError("Computer Use implementation selected but no config found")
 
-    print(f"   Implementation: {impl}")
+    detail(f"   Implementation: {impl}")
     return True
 
 
 @test("Anthropic API key configured")
 def test_api_key():
     """Test that Anthropic API key is set and accessible"""
+    # Importing config loads .env once for the whole process
     import config as cfg
-    from dotenv import load_dotenv
-
-    load_dotenv()
 
     api_key = cfg.get_anthropic_api_key()
 
@@ -109,28 +160,59 @@ def test_api_key():
     if not api_key.startswith('sk-ant-'):
         raise ValueError(f"Invalid API key format: {api_key[:10]}...")
 
-    print(f"   API key: {api_key[:15]}...")
+    detail(f"   API key: {api_key[:15]}...")
     return True
 
 
 @test("Anthropic API connectivity")
-def test_api_connectivity():
+async def test_api_connectivity():
     """Test that we can connect to Anthropic API"""
     import anthropic
     import config as cfg
 
     api_key = cfg.get_anthropic_api_key()
-    client = anthropic.Anthropic(api_key=api_key)
+    model = 'claude-sonnet-4-5'
+    prompt = 'Hi'
+
+    # Only a hash of the key is stored
+    cache_key = hashlib.sha256(f"{api_key}:{model}:{prompt}".encode()).hexdigest()
+    try:
+        cache = json.loads(API_PROBE_CACHE.read_text())
+    except (OSError, ValueError):
+        cache = {}
+
+    client = anthropic.AsyncAnthropic(api_key=api_key)
+
+    cached = cache.get(cache_key)
+    if cached and cached['ts'] > time.time() - API_PROBE_TTL:
+        # Skip the message round-trip, but still check the network and the
+        # key with a free call; this raises if either is gone
+        await client.models.list(limit=1)
+        detail(f"   Model: {cached['model']} (cached, key verified)")
+        detail(f"   Response: {cached['text'][:30]}...")
+        return True
 
     # Make a simple API call
-    response = client.messages.create(
-        model='claude-sonnet-4-5',
+    response = await client.messages.create(
+        model=model,
         max_tokens=10,
-        messages=[{'role': 'user', 'content': 'Hi'}]
+        messages=[{'role': 'user', 'content': prompt}]
     )
 
-    print(f"   Model: {response.model}")
-    print(f"   Response: {response.content[0].text[:30]}...")
+    detail(f"   Model: {response.model}")
+    detail(f"   Response: {response.content[0].text[:30]}...")
+
+    cache[cache_key] = {
+        'ts': time.time(),
+        'model': response.model,
+        'text': response.content[0].text,
+    }
+    try:
+        API_PROBE_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        API_PROBE_CACHE.write_text(json.dumps(cache))
+    except OSError:
+        pass  # Caching is best-effort
+
     return True
 
 
@@ -141,11 +223,11 @@ def test_desktop_automation():
 
     # Test getting screen size
     width, height = pyautogui.size()
-    print(f"   Screen size: {width}x{height}")
+    detail(f"   Screen size: {width}x{height}")
 
     # Test getting mouse position (doesn't move mouse)
     x, y = pyautogui.position()
-    print(f"   Mouse position: ({x}, {y})")
+    detail(f"   Mouse position: ({x}, {y})")
 
     return True
 
@@ -153,7 +235,7 @@ def test_desktop_automation():
 @test("Screenshot capture tool")
 def test_screenshot_tool():
     """Test basic screenshot capture tool"""
-    from screenshot.computer_use_tools import ComputerUseTool
+    from screenshot.computer_use_tools import ComputerUseTool, IMAGE_FORMATS
 
     async def capture_test():
         tool = ComputerUseTool(display_width=1280, display_height=800)
@@ -165,14 +247,15 @@ def test_screenshot_tool():
         if not isinstance(screenshot, str):
             raise TypeError(f"Expected string, got {type(screenshot)}")
 
-        if not screenshot.startswith('data:image/png;base64,'):
+        subtype = IMAGE_FORMATS[tool.image_format][1]
+        if not screenshot.startswith(f'data:image/{subtype};base64,'):
             raise ValueError("Screenshot doesn't have correct data URI format")
 
         # Check length (should be substantial)
         if len(screenshot) < 1000:
             raise ValueError(f"Screenshot too small: {len(screenshot)} chars")
 
-        print(f"   Screenshot size: {len(screenshot)} chars")
+        detail(f"   Screenshot size: {len(screenshot)} chars")
         return screenshot
 
     screenshot = asyncio.run(capture_test())
@@ -194,8 +277,8 @@ def test_client_init():
         display_height=800
     )
 
-    print(f"   Model: {client.model}")
-    print(f"   Display: {client.display_width}x{client.display_height}")
+    detail(f"   Model: {client.model}")
+    detail(f"   Display: {client.display_width}x{client.display_height}")
 
     return client
 
@@ -203,12 +286,12 @@ def test_client_init():
 @test("Factory pattern works")
 def test_factory():
     """Test that factory pattern can create Computer Use capturer"""
-    from screenshot.factory import create_capturer
+    from screenshot.factory import build_capturer
 
     # Try to create Computer Use capturer
     try:
-        capturer = create_capturer(implementation="computer_use")
-        print(f"   Capturer type: {type(capturer).__name__}")
+        capturer = build_capturer(provider="computer_use")
+        detail(f"   Capturer type: {type(capturer).__name__}")
         return capturer
     except Exception as e:
         raise RuntimeError(f"Failed to create Computer Use capturer: {e}")
@@ -218,22 +301,19 @@ def test_factory():
 def test_credentials():
     """Test that authentication credentials are configured"""
     import config as cfg
-    from dotenv import load_dotenv
-
-    load_dotenv()
 
     screenshot_config = cfg.get_screenshot_config()
 
     # Only test if Computer Use is configured
     if screenshot_config.get('implementation') != 'computer_use':
-        print("   Skipped (not using Computer Use)")
+        detail("   Skipped (not using Computer Use)")
         return True
 
     cu_config = cfg.get_computer_use_config()
     auth_config = cu_config.get('auth', {})
 
     if not auth_config.get('enabled'):
-        print("   Authentication disabled in config")
+        detail("   Authentication disabled in config")
         return True
 
     # Check for username and password in environment
@@ -246,8 +326,8 @@ def test_credentials():
     if not password:
         raise ValueError("SCREENSHOT_PASS not set in .env")
 
-    print(f"   Username: {username}")
-    print(f"   Password: {'*' * len(password)}")
+    detail(f"   Username: {username}")
+    detail(f"   Password: {'*' * len(password)}")
 
     return True
 
@@ -343,34 +423,60 @@ def print_next_steps(all_passed):
         print("  docs/computer-use-setup.md\n")
 
 
+async def run_tests():
+    """
+    Run the tests concurrently, in two waves
+
+    The first wave checks local setup (dependencies, config, desktop). The
+    second wave needs a configured API key, so it starts once the first
+    wave is done; within each wave the tests overlap their I/O. If any
+    local check fails, the network-bound second wave is skipped.
+    """
+    local_checks = [
+        test_dependencies,
+        test_configuration,
+        test_api_key,
+        test_credentials,
+        test_desktop_automation,
+        test_screenshot_tool,
+    ]
+    api_checks = [
+        test_api_connectivity,
+        test_client_init,
+        test_factory,
+    ]
+
+    await asyncio.gather(*[t() for t in local_checks], return_exceptions=True)
+
+    if not all(success for _, success, _ in test_results):
+        for t in api_checks:
+            test_output[t.test_name] = f"⏭️  {t.test_name}\n   Skipped (local checks failed)"
+        return
+
+    await asyncio.gather(*[t() for t in api_checks], return_exceptions=True)
+
+
 def main():
     """Run all tests"""
     print("🧪 Computer Use Test Suite")
     print("=" * 60)
 
-    # Test 1: Dependencies
-    print_header("Testing Dependencies")
-    test_dependencies()
-
-    # Test 2: Configuration
-    print_header("Testing Configuration")
-    test_configuration()
-    test_api_key()
-    test_credentials()
-
-    # Test 3: API Connectivity
-    print_header("Testing API Connectivity")
-    test_api_connectivity()
-
-    # Test 4: Desktop Automation
-    print_header("Testing Desktop Automation")
-    test_desktop_automation()
-    test_screenshot_tool()
-
-    # Test 5: Computer Use Components
-    print_header("Testing Computer Use Components")
-    test_client_init()
-    test_factory()
+    sections = [
+        ("Testing Dependencies", [test_dependencies]),
+        ("Testing Configuration", [test_configuration, test_api_key, test_credentials]),
+        ("Testing Desktop Automation", [test_desktop_automation, test_screenshot_tool]),
+        ("Testing API Connectivity", [test_api_connectivity]),
+        ("Testing Computer Use Components", [test_client_init, test_factory]),
+    ]
+
+    asyncio.run(run_tests())
+
+    # Each test's output is already one block; write the report in one go
+    report = []
+    for title, section_tests in sections:
+        report.append(format_header(title))
+        report.extend(test_output[t.test_name] for t in section_tests)
+    sys.stdout.write("\n".join(report) + "\n")
 
     # Print summary
     all_passed = print_summary()
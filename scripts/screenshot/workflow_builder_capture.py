@@ -6,11 +6,13 @@ import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from screenshot.factory import create_capturer_from_plan
-import config as cfg
 
 def capture_workflow_builder_screenshots():
     """Capture screenshots for the Workflow Builder feature"""
+    # Imported here so importing this module stays cheap
+    from screenshot.factory import create_capturer_from_plan
+    import config as cfg
+
     base_url = cfg.get_product_url()
 
     screenshot_plan = [
@@ -7,10 +7,9 @@ Guides first-time users through configuration with a friendly, step-by-step proc
 
 import os
 import sys
-import subprocess
+import shutil
+import functools
 from pathlib import Path
-import yaml
-import json
 
 # Add project root to path (must be first for utils/ imports)
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -26,27 +25,33 @@ class Colors:
     BOLD = '\033[1m'
     END = '\033[0m'
 
+    # Complete message lines with colors baked in, filled with %
+    HEADER_FMT = f"\n{BOLD}{BLUE}{'='*70}\n%s\n{'='*70}{END}\n\n"
+    SUCCESS_FMT = f"{GREEN}✅ %s{END}\n"
+    WARN_FMT = f"{YELLOW}⚠️  %s{END}\n"
+    ERROR_FMT = f"{RED}❌ %s{END}\n"
+    INFO_FMT = f"{BLUE}ℹ️  %s{END}\n"
+
 def print_header(text):
-    """Print a section header"""
-    print(f"\n{Colors.BOLD}{Colors.BLUE}{'='*70}")
-    print(f"{text.center(70)}")
-    print(f"{'='*70}{Colors.END}\n")
+    """Print a section header, flushing the previous screen's block-buffered output"""
+    sys.stdout.write(Colors.HEADER_FMT % text.center(70))
+    sys.stdout.flush()
 
 def print_success(text):
     """Print success message"""
-    print(f"{Colors.GREEN}✅ {text}{Colors.END}")
+    sys.stdout.write(Colors.SUCCESS_FMT % text)
 
 def print_warning(text):
     """Print warning message"""
-    print(f"{Colors.YELLOW}⚠️  {text}{Colors.END}")
+    sys.stdout.write(Colors.WARN_FMT % text)
 
 def print_error(text):
     """Print error message"""
-    print(f"{Colors.RED}❌ {text}{Colors.END}")
+    sys.stdout.write(Colors.ERROR_FMT % text)
 
 def print_info(text):
     """Print info message"""
-    print(f"{Colors.BLUE}ℹ️  {text}{Colors.END}")
+    sys.stdout.write(Colors.INFO_FMT % text)
 
 def ask_question(question, default=None, options=None):
     """Ask user a question"""
@@ -72,13 +77,10 @@ def check_file_exists(filepath):
     """Check if a file exists"""
     return Path(filepath).exists()
 
+@functools.lru_cache(maxsize=None)
 def check_command_exists(command):
-    """Check if a command exists in PATH"""
-    try:
-        subprocess.run([command, '--version'], capture_output=True, check=True)
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+    """Check if a command exists in PATH (a PATH lookup; nothing is run)"""
+    return shutil.which(command) is not None
 
 def welcome_screen():
     """Display welcome screen"""
@@ -286,14 +288,22 @@ def setup_zendesk():
 
 def create_config_file(provider, provider_config):
     """Create config.yaml file"""
+    # Imported here so the welcome screen and requirement checks don't wait on it
+    import yaml
+
+    # libyaml's C parser/emitter when PyYAML was built with it
+    try:
+        from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+    except ImportError:
+        from yaml import SafeLoader, SafeDumper
+
     print_header("Step 3: Creating Configuration")
 
     # Load example config
     example_config_path = Path(__file__).parent.parent / 'config.example.yaml'
 
     if example_config_path.exists():
-        with open(example_config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config = yaml.load(example_config_path.read_bytes(), Loader=SafeLoader) or {}
     else:
         config = {}
 
@@ -309,6 +319,14 @@ def create_config_file(provider, provider_config):
 
         config['knowledge_base']['providers'][config['knowledge_base']['provider']] = provider_config
 
+    # Env var name for each collection, shared by .env and config.yaml
+    collection_env_names = {}
+    if provider_config:
+        collection_env_names = {
+            name: f"COLLECTION_{name.upper().replace('-', '_')}_ID"
+            for name in provider_config.get('collections', {})
+        }
+
     # Create .env file for secrets
     env_path = Path(__file__).parent.parent / '.env'
     env_vars = []
@@ -320,15 +338,15 @@ def create_config_file(provider, provider_config):
             f"PYLON_AUTHOR_ID={provider_config.get('author_user_id', '')}",
         ])
         for name, coll_id in provider_config.get('collections', {}).items():
-            var_name = f"COLLECTION_{name.upper().replace('-', '_')}_ID"
-            env_vars.append(f"{var_name}={coll_id}")
+            env_vars.append(f"{collection_env_names[name]}={coll_id}")
 
     # Write .env file
     if env_vars:
-        with open(env_path, 'w') as f:
-            f.write("# max-doc-ai Environment Variables\n")
-            f.write("# Generated by setup wizard\n\n")
-            f.write('\n'.join(env_vars))
+        env_path.write_text(
+            "# max-doc-ai Environment Variables\n"
+            "# Generated by setup wizard\n\n"
+            + '\n'.join(env_vars) + '\n'
+        )
         print_success(f"Created .env file with your credentials")
 
     # Update config to use env vars
@@ -337,16 +355,15 @@ def create_config_file(provider, provider_config):
         config['knowledge_base']['providers']['pylon']['kb_id'] = '${PYLON_KB_ID}'
         config['knowledge_base']['providers']['pylon']['author_user_id'] = '${PYLON_AUTHOR_ID}'
 
-        collections = {}
-        for name in provider_config.get('collections', {}).keys():
-            var_name = f"COLLECTION_{name.upper().replace('-', '_')}_ID"
-            collections[name] = f"${{{var_name}}}"
+        collections = {
+            name: f"${{{var_name}}}" for name, var_name in collection_env_names.items()
+        }
         config['knowledge_base']['providers']['pylon']['collections'] = collections
 
     # Write config.yaml
     config_path = Path(__file__).parent.parent / 'config.yaml'
-    with open(config_path, 'w') as f:
-        yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+    config_yaml = yaml.dump(config, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
+    config_path.write_bytes(config_yaml.encode('utf-8'))
 
     print_success(f"Created config.yaml")
     print_info(f"Config file: {config_path}")
@@ -380,7 +397,8 @@ def verify_setup():
         if provider:
             print_success(f"Provider '{provider_name}' initialized")
 
-            # Test connection
+            # Test connection (network I/O: show progress so far first)
+            sys.stdout.flush()
             if provider.test_connection():
                 print_success(f"✨ Connection to {provider_name} successful!")
             else:
@@ -444,6 +462,13 @@ def show_next_steps():
 
 def main():
     """Main setup wizard"""
+    # A terminal stdout is line buffered, so every printed line is its own
+    # write. Block-buffer it instead: input() flushes before each prompt,
+    # print_header() at each new step, and verify_setup() before the network
+    # check, so nothing sits in the buffer while the wizard waits.
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(line_buffering=False)
+
     try:
         # Welcome
         welcome_screen()
@@ -25,6 +25,8 @@ async def test_gemini_capture():
 
     # Initialize client
     client = GeminiComputerUseClient(api_key=api_key)
+    if not await client.preconnect():
+        print("⚠️  Could not reach the Gemini API ahead of the task")
     
     # Initialize tool executor (no-op for test if no display, but we want to test flow)
     # We use a dummy width/height
@@ -6,17 +6,20 @@ Handles cloning and accessing external GitHub repositories.
 """
 
 import os
+import zlib
+import configparser
 import subprocess
 import shutil
+from collections import deque
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 
 
 class GitHubHelper:
     """Helper for working with GitHub repositories"""
 
     def __init__(self, repo_url: str, auth_method: str = 'gh',
-                 github_pat: Optional[str] = None):
+                 github_pat: Optional[str] = None, shallow: bool = True):
         """
         Initialize GitHub helper
 
@@ -24,18 +27,26 @@ class GitHubHelper:
             repo_url: GitHub repository URL
             auth_method: 'gh' | 'pat' | 'ssh'
             github_pat: Personal Access Token (if auth_method='pat')
+            shallow: Clone only the tip of the default branch (default: True);
+                set False when the git history is needed
         """
         self.repo_url = repo_url
         self.auth_method = auth_method
         self.github_pat = github_pat
+        self.shallow = shallow
         self.working_dir = None
 
-    def clone_repository(self, target_dir: Optional[str] = None) -> str:
+    def clone_repository(self, target_dir: Optional[str] = None,
+                         force_fresh: bool = False) -> str:
         """
         Clone repository to local directory
 
+        If the target already holds a clone of the same repository, it is
+        updated in place instead of being deleted and cloned again.
+
         Args:
             target_dir: Target directory (default: temp dir)
+            force_fresh: Always delete the target and clone from scratch
 
         Returns:
             Path to cloned repository
@@ -50,6 +61,11 @@ class GitHubHelper:
 
         target_path = Path(target_dir)
 
+        if not force_fresh and self._is_same_repo(target_path):
+            if self._update_clone(target_path):
+                self.working_dir = str(target_path)
+                return self.working_dir
+
         # Remove if already exists
         if target_path.exists():
             shutil.rmtree(target_path)
@@ -57,21 +73,18 @@ class GitHubHelper:
         print(f"📥 Cloning repository: {self.repo_url}")
         print(f"   Target: {target_path}")
 
+        # Only the working tree is read, so skip history and fetch blobs lazily
+        clone_args = ['--depth', '1', '--filter=blob:none', '--single-branch'] if self.shallow else []
+
         # Clone based on auth method
         if self.auth_method == 'gh':
-            # Use GitHub CLI (requires gh auth)
-            result = subprocess.run(
-                ['gh', 'repo', 'clone', self.repo_url, str(target_path)],
-                capture_output=True,
-                text=True
-            )
+            # Use GitHub CLI (requires gh auth); args after -- go to git clone
+            cmd = ['gh', 'repo', 'clone', self.repo_url, str(target_path)]
+            if clone_args:
+                cmd += ['--', *clone_args]
         elif self.auth_method == 'ssh':
             # Use SSH (requires configured keys)
-            result = subprocess.run(
-                ['git', 'clone', self.repo_url, str(target_path)],
-                capture_output=True,
-                text=True
-            )
+            cmd = ['git', 'clone', *clone_args, self.repo_url, str(target_path)]
         elif self.auth_method == 'pat':
             # Use PAT in URL
             if not self.github_pat:
@@ -82,23 +95,95 @@ class GitHubHelper:
                 'https://',
                 f'https://{self.github_pat}@'
             )
-            result = subprocess.run(
-                ['git', 'clone', auth_url, str(target_path)],
-                capture_output=True,
-                text=True
-            )
+            cmd = ['git', 'clone', *clone_args, auth_url, str(target_path)]
         else:
             raise ValueError(f"Unknown auth method: {self.auth_method}")
 
-        if result.returncode != 0:
+        returncode, tail = self._run_stream(cmd)
+        if returncode != 0:
             raise RuntimeError(
-                f"Failed to clone repository:\n{result.stderr}"
+                "Failed to clone repository:\n" + "".join(tail)
             )
 
         print(f"   ✅ Cloned successfully")
         self.working_dir = str(target_path)
         return self.working_dir
 
+    def _is_same_repo(self, path: Path) -> bool:
+        """Whether path is a git clone whose origin is this repository"""
+        if not (path / '.git').exists():
+            return False
+
+        result = subprocess.run(
+            ['git', '-C', str(path), 'remote', 'get-url', 'origin'],
+            capture_output=True,
+            text=True
+        )
+        return (
+            result.returncode == 0
+            and _normalize_url(result.stdout.strip()) == _normalize_url(self.repo_url)
+        )
+
+    def _update_clone(self, path: Path) -> bool:
+        """
+        Bring an existing clone up to date with origin
+
+        Fetches the latest commit, then resets and cleans the working tree
+        so it matches a fresh clone.
+
+        Returns:
+            True on success, False if the clone should be redone
+        """
+        print(f"🔄 Updating existing clone: {path}")
+
+        fetch = ['git', '-C', str(path), 'fetch']
+        if self.shallow:
+            fetch += ['--depth', '1']
+
+        for cmd in (
+            fetch + ['origin'],
+            ['git', '-C', str(path), 'reset', '--hard', 'FETCH_HEAD'],
+            ['git', '-C', str(path), 'clean', '-ffdx'],
+        ):
+            returncode, _ = self._run_stream(cmd)
+            if returncode != 0:
+                print(f"   ⚠️  Update failed, cloning again")
+                return False
+
+        print(f"   ✅ Updated successfully")
+        return True
+
+    def _run_stream(self, cmd: List[str], tail_lines: int = 20) -> Tuple[int, List[str]]:
+        """
+        Run a command, echoing its output as it arrives
+
+        Only the last few lines are kept, so a long clone log is never held
+        in memory; they are returned for error messages. A PAT is masked.
+
+        Args:
+            cmd: Command and arguments
+            tail_lines: Number of trailing output lines to keep
+
+        Returns:
+            (exit code, last output lines)
+        """
+        tail = deque(maxlen=tail_lines)
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=8192
+        )
+        with process.stdout:
+            for line in process.stdout:
+                if self.github_pat:
+                    line = line.replace(self.github_pat, '***')
+                tail.append(line)
+                print(f"   {line}", end='')
+
+        return process.wait(), list(tail)
+
     def cleanup(self):
         """Remove cloned repository"""
         if self.working_dir and Path(self.working_dir).exists():
@@ -116,6 +201,19 @@ class GitHubHelper:
         pass
 
 
+def _normalize_url(url: str) -> str:
+    """Reduce a repository URL to a comparable form (no credentials, no .git)"""
+    scheme, sep, rest = url.partition('://')
+    if sep:
+        # Drop user/token info: https://<pat>@github.com/... -> github.com/...
+        rest = rest.rpartition('@')[2]
+        url = rest
+    url = url.rstrip('/')
+    if url.endswith('.git'):
+        url = url[:-len('.git')]
+    return url.lower()
+
+
 def get_repo_info(repo_path: str) -> dict:
     """
     Get information about a git repository
@@ -126,6 +224,75 @@ def get_repo_info(repo_path: str) -> dict:
     Returns:
         dict with remote, branch, commit info
     """
+    # Plain checkouts are read straight from .git; anything unusual
+    # (worktrees, submodules, packed objects) is left to git itself
+    return _read_git_dir(Path(repo_path)) or _git_repo_info(repo_path)
+
+
+def _read_git_dir(repo_path: Path) -> Optional[dict]:
+    """
+    Read remote, branch and commit info from a checkout's .git directory
+
+    Args:
+        repo_path: Path to repository
+
+    Returns:
+        Same dict as get_repo_info, or None if the layout needs git to resolve
+    """
+    git_dir = repo_path / '.git'
+    if not git_dir.is_dir():
+        return None
+
+    try:
+        head = (git_dir / 'HEAD').read_text().strip()
+        if head.startswith('ref: '):
+            ref = head[len('ref: '):]
+            branch = ref[len('refs/heads/'):] if ref.startswith('refs/heads/') else ''
+            sha = _resolve_ref(git_dir, ref)
+        else:
+            branch, sha = '', head
+        if not sha:
+            return None
+
+        # Loose object: zlib("commit <size>\0<headers>\n\n<message>")
+        obj_path = git_dir / 'objects' / sha[:2] / sha[2:]
+        if not obj_path.exists():
+            return None
+        obj = zlib.decompress(obj_path.read_bytes())
+        message = obj.split(b'\0', 1)[1].partition(b'\n\n')[2].decode('utf-8', 'replace')
+        # %s is the first paragraph with its lines joined
+        subject = ' '.join(message.split('\n\n', 1)[0].split('\n')).strip()
+
+        result = {}
+        parser = configparser.ConfigParser(strict=False, interpolation=None)
+        parser.read(git_dir / 'config')
+        if parser.has_option('remote "origin"', 'url'):
+            result['remote'] = parser.get('remote "origin"', 'url')
+    except (OSError, ValueError, IndexError, zlib.error, configparser.Error):
+        return None
+
+    result['commit'] = f"{sha} {subject}"
+    result['branch'] = branch
+    return result
+
+
+def _resolve_ref(git_dir: Path, ref: str) -> Optional[str]:
+    """Look up a ref's commit in its loose file or in packed-refs"""
+    ref_path = git_dir / ref
+    if ref_path.is_file():
+        return ref_path.read_text().strip()
+
+    packed = git_dir / 'packed-refs'
+    if packed.is_file():
+        for line in packed.read_text().splitlines():
+            sha, _, name = line.partition(' ')
+            if name == ref:
+                return sha
+    return None
+
+
+def _git_repo_info(repo_path: str) -> dict:
+    """Get repository info by asking git (see get_repo_info)"""
     result = {}
 
     # Get remote URL
@@ -137,22 +304,18 @@ def get_repo_info(repo_path: str) -> dict:
     if remote_result.returncode == 0:
         result['remote'] = remote_result.stdout.strip()
 
-    # Get current branch
-    branch_result = subprocess.run(
-        ['git', '-C', repo_path, 'branch', '--show-current'],
+    # Get latest commit and current branch in one call: %D lists the refs
+    # at HEAD, starting with "HEAD -> <branch>" unless HEAD is detached
+    log_result = subprocess.run(
+        ['git', '-C', repo_path, 'log', '-1', '--format=%H %s%x00%D'],
         capture_output=True,
         text=True
     )
-    if branch_result.returncode == 0:
-        result['branch'] = branch_result.stdout.strip()
+    if log_result.returncode == 0:
+        commit, _, refs = log_result.stdout.strip().partition('\0')
+        result['commit'] = commit
 
-    # Get latest commit
-    commit_result = subprocess.run(
-        ['git', '-C', repo_path, 'log', '-1', '--format=%H %s'],
-        capture_output=True,
-        text=True
-    )
-    if commit_result.returncode == 0:
-        result['commit'] = commit_result.stdout.strip()
+        head = refs.split(', ')[0]
+        result['branch'] = head[len('HEAD -> '):] if head.startswith('HEAD -> ') else ''
 
     return result
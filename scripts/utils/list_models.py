@@ -2,7 +2,6 @@
 import os
 import sys
 from pathlib import Path
-import google.generativeai as genai
 
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -14,12 +13,20 @@ if not api_key:
     print("❌ No API key found")
     sys.exit(1)
 
+# Imported after the key check; google.generativeai is slow to import
+import google.generativeai as genai
+
 genai.configure(api_key=api_key)
 
 print("🔍 Listing available models...")
 try:
-    for m in genai.list_models():
-        if 'generateContent' in m.supported_generation_methods:
-            print(f"- {m.name}")
+    names = [
+        m.name for m in genai.list_models()
+        if 'generateContent' in m.supported_generation_methods
+    ]
+    if names:
+        sys.stdout.write("- " + "\n- ".join(names) + "\n")
+    else:
+        print("- (none)")
 except Exception as e:
     print(f"❌ Error listing models: {e}")
@@ -5,7 +5,53 @@ Helper functions for parsing and manipulating markdown documentation.
 """
 
 import re
-from typing import Dict, Optional, Tuple
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+# Patterns are compiled once at import rather than looked up on every call
+# Markdown image ![alt text](url) or HTML image <img src="url" alt="alt text">,
+# matched together so the document is scanned once
+_IMG_RE = re.compile(
+    r'!\[(?P<md_alt>[^\]]*)\]\((?P<md_url>[^\)]+)\)'
+    r'|<img[^>]*src="(?P<html_url>[^"]*)"[^>]*alt="(?P<html_alt>[^"]*)"[^>]*>'
+)
+_INLINE_CODE_RE = re.compile(r'`[^`]+`')
+# Markdown syntax characters dropped before counting words; str.translate
+# deletes them without going through the regex engine
+_MD_SYNTAX_STRIP = str.maketrans('', '', '#*_[]()')
+
+
+def _iter_lines(text: str) -> Iterator[str]:
+    """Yield the lines of text one at a time instead of building a list of them"""
+    start = 0
+    length = len(text)
+    while start < length:
+        end = text.find('\n', start)
+        if end < 0:
+            end = length
+        yield text[start:end]
+        start = end + 1
+
+
+def _lines_starting_with(text: str, prefix: str) -> Iterator[str]:
+    """Yield only the lines that start with prefix, jumping between them with str.find"""
+    needle = '\n' + prefix
+    start = 0
+    if not text.startswith(prefix):
+        start = text.find(needle)
+        if start < 0:
+            return
+        start += 1
+
+    while True:
+        end = text.find('\n', start)
+        if end < 0:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = text.find(needle, end)
+        if start < 0:
+            return
+        start += 1
 
 
 def extract_title(md_content: str) -> Optional[str]:
@@ -18,10 +64,8 @@ def extract_title(md_content: str) -> Optional[str]:
     Returns:
         Title string, or None if no H1 found
     """
-    lines = md_content.split('\n')
-    for line in lines:
-        if line.startswith('# '):
-            return line[2:].strip()
+    for line in _lines_starting_with(md_content, '# '):
+        return line[2:].strip()
     return None
 
 
@@ -54,9 +98,9 @@ def extract_frontmatter(md_content: str) -> Tuple[Optional[Dict], str]:
 
     # Parse frontmatter (simple key: value format)
     frontmatter = {}
-    for line in frontmatter_text.strip().split('\n'):
-        if ':' in line:
-            key, value = line.split(':', 1)
+    for line in _iter_lines(frontmatter_text.strip()):
+        key, sep, value = line.partition(':')
+        if sep:
             frontmatter[key.strip()] = value.strip()
 
     return frontmatter, content.lstrip()
@@ -76,14 +120,14 @@ def add_frontmatter(md_content: str, frontmatter: Dict) -> str:
     # Remove existing frontmatter if present
     _, content = extract_frontmatter(md_content)
 
-    # Build frontmatter
-    fm_lines = ['---']
-    for key, value in frontmatter.items():
-        fm_lines.append(f'{key}: {value}')
-    fm_lines.append('---')
-    fm_lines.append('')
+    # Build frontmatter and content in one join, so the result is the only
+    # full-size string allocated
+    parts = ['---\n']
+    parts.extend(f'{key}: {value}\n' for key, value in frontmatter.items())
+    parts.append('---\n')
+    parts.append(content)
 
-    return '\n'.join(fm_lines) + content
+    return ''.join(parts)
 
 
 def extract_image_references(md_content: str) -> list:
@@ -96,23 +140,20 @@ def extract_image_references(md_content: str) -> list:
         md_content: Markdown content string
 
     Returns:
-        List of dicts with 'alt' and 'url' keys
+        List of dicts with 'alt' and 'url' keys, in document order
     """
     images = []
 
-    # Find markdown images: ![alt text](url)
-    md_pattern = r'!\[([^\]]*)\]\(([^\)]+)\)'
-    for match in re.finditer(md_pattern, md_content):
-        alt = match.group(1)
-        url = match.group(2)
-        images.append({'alt': alt, 'url': url, 'format': 'markdown'})
+    # Most documents are mostly prose; substring checks (memchr-backed)
+    # rule out image-free text without starting the regex engine at all
+    if '![' not in md_content and '<img' not in md_content:
+        return images
 
-    # Find HTML images: <img src="url" alt="alt text">
-    html_pattern = r'<img[^>]*src="([^"]*)"[^>]*alt="([^"]*)"[^>]*>'
-    for match in re.finditer(html_pattern, md_content):
-        url = match.group(1)
-        alt = match.group(2)
-        images.append({'alt': alt, 'url': url, 'format': 'html'})
+    for match in _IMG_RE.finditer(md_content):
+        if match.group('md_url') is not None:
+            images.append({'alt': match.group('md_alt'), 'url': match.group('md_url'), 'format': 'markdown'})
+        else:
+            images.append({'alt': match.group('html_alt'), 'url': match.group('html_url'), 'format': 'html'})
 
     return images
 
@@ -128,16 +169,21 @@ def replace_image_urls(md_content: str, url_mapping: Dict[str, str]) -> str:
     Returns:
         Markdown content with updated URLs
     """
-    result = md_content
+    if not url_mapping:
+        return md_content
 
-    for old_url, new_url in url_mapping.items():
-        # Replace in markdown format
-        result = result.replace(f']({old_url})', f']({new_url})')
+    # One pass over the document for all URLs. Longest first so a URL that
+    # is a prefix of another can't shadow it; the surrounding ]( ) or src=""
+    # keeps plain-text mentions of a URL untouched.
+    urls = '|'.join(re.escape(url) for url in sorted(url_mapping, key=len, reverse=True))
+    pattern = re.compile(rf'(\]\()({urls})(\))|(src=")({urls})(")')
 
-        # Replace in HTML format
-        result = result.replace(f'src="{old_url}"', f'src="{new_url}"')
+    def replace(match: re.Match) -> str:
+        if match.group(2) is not None:
+            return match.group(1) + url_mapping[match.group(2)] + match.group(3)
+        return match.group(4) + url_mapping[match.group(5)] + match.group(6)
 
-    return result
+    return pattern.sub(replace, md_content)
 
 
 def count_words(md_content: str) -> int:
@@ -150,18 +196,25 @@ def count_words(md_content: str) -> int:
     Returns:
         Word count
     """
-    # Remove code blocks
-    content = re.sub(r'```.*?```', '', md_content, flags=re.DOTALL)
+    total = 0
+    in_fence = False
 
-    # Remove inline code
-    content = re.sub(r'`[^`]+`', '', content)
+    # Walk lines, skipping fenced code blocks, instead of cutting them out
+    # of a copy of the document with a DOTALL regex
+    for line in _iter_lines(md_content):
+        if line.lstrip().startswith('```'):
+            in_fence = not in_fence
+            continue
+        if not in_fence:
+            total += _line_word_count(line)
 
-    # Remove markdown syntax
-    content = re.sub(r'[#*_\[\]()]', '', content)
+    return total
 
-    # Count words
-    words = content.split()
-    return len(words)
+
+def _line_word_count(line: str) -> int:
+    """Count words on a line outside code blocks, ignoring inline code and syntax"""
+    line = _INLINE_CODE_RE.sub('', line)
+    return len(line.translate(_MD_SYNTAX_STRIP).split())
 
 
 def extract_headings(md_content: str) -> list:
@@ -176,19 +229,13 @@ def extract_headings(md_content: str) -> list:
     """
     headings = []
 
-    for line in md_content.split('\n'):
-        if line.startswith('#'):
-            # Count # characters for heading level
-            level = 0
-            for char in line:
-                if char == '#':
-                    level += 1
-                else:
-                    break
-
-            if 1 <= level <= 6:
-                text = line[level:].strip()
-                headings.append({'level': level, 'text': text})
+    for line in _lines_starting_with(md_content, '#'):
+        # Count # characters for heading level
+        stripped = line.lstrip('#')
+        level = len(line) - len(stripped)
+
+        if 1 <= level <= 6:
+            headings.append({'level': level, 'text': stripped.strip()})
 
     return headings
 
@@ -208,32 +255,80 @@ def validate_markdown_structure(md_content: str) -> Tuple[bool, list]:
     Returns:
         Tuple of (is_valid, list_of_issues)
     """
-    issues = []
-    headings = extract_headings(md_content)
+    analysis = analyze(md_content)
+    return analysis.is_valid, analysis.issues
 
-    # Check for H1
-    h1_count = sum(1 for h in headings if h['level'] == 1)
-    if h1_count == 0:
-        issues.append("No H1 heading found")
-    elif h1_count > 1:
-        issues.append(f"Multiple H1 headings found ({h1_count})")
 
-    # Check heading hierarchy
+class MarkdownAnalysis(NamedTuple):
+    """Everything analyze() learns about a markdown document"""
+    title: Optional[str]
+    headings: List[Dict]
+    images: List[Dict]
+    word_count: int
+    is_valid: bool
+    issues: List[str]
+
+
+def analyze(md_content: str) -> MarkdownAnalysis:
+    """
+    Analyze markdown content in a single pass over its lines
+
+    Gives the same title, headings and images as the individual extract_*
+    helpers without re-scanning the document for each one, and checks the
+    structure as headings go by (validate_markdown_structure reads its
+    result from here).
+
+    Args:
+        md_content: Markdown content string
+
+    Returns:
+        MarkdownAnalysis with title, headings, images, word count and issues
+    """
+    title = None
+    headings = []
+    word_count = 0
+    in_fence = False
+
+    # Structure checks, tracked as headings go by
+    h1_count = 0
     prev_level = 0
-    for heading in headings:
-        level = heading['level']
-        if level > prev_level + 1:
-            issues.append(f"Heading hierarchy skip: H{prev_level} to H{level}")
-        prev_level = level
+    hierarchy_skips = []
+
+    for line in _iter_lines(md_content):
+        if line.lstrip().startswith('```'):
+            in_fence = not in_fence
+            continue
+
+        if line.startswith('#'):
+            if title is None and line.startswith('# '):
+                title = line[2:].strip()
+            stripped = line.lstrip('#')
+            level = len(line) - len(stripped)
+            if level <= 6:
+                headings.append({'level': level, 'text': stripped.strip()})
+
+                if level == 1:
+                    h1_count += 1
+                if level > prev_level + 1:
+                    hierarchy_skips.append(f"Heading hierarchy skip: H{prev_level} to H{level}")
+                prev_level = level
+
+        if not in_fence:
+            word_count += _line_word_count(line)
 
-    # Check for broken image references
     images = extract_image_references(md_content)
-    for img in images:
-        if not img['url'].strip():
-            issues.append(f"Empty image URL for: {img['alt']}")
 
-    is_valid = len(issues) == 0
-    return is_valid, issues
+    issues = []
+    if h1_count == 0:
+        issues.append("No H1 heading found")
+    elif h1_count > 1:
+        issues.append(f"Multiple H1 headings found ({h1_count})")
+    issues.extend(hierarchy_skips)
+    issues.extend(
+        f"Empty image URL for: {img['alt']}" for img in images if not img['url'].strip()
+    )
+
+    return MarkdownAnalysis(title, headings, images, word_count, not issues, issues)
 
 
 if __name__ == '__main__':
@@ -253,25 +348,21 @@ if __name__ == '__main__':
     print("Markdown Analysis")
     print("=" * 60)
 
-    title = extract_title(content)
-    print(f"Title: {title}")
+    analysis = analyze(content)
+    print(f"Title: {analysis.title}")
 
-    words = count_words(content)
-    print(f"Word count: {words}")
+    print(f"Word count: {analysis.word_count}")
 
-    headings = extract_headings(content)
-    print(f"\nHeadings ({len(headings)}):")
-    for h in headings:
+    print(f"\nHeadings ({len(analysis.headings)}):")
+    for h in analysis.headings:
         indent = "  " * (h['level'] - 1)
         print(f"{indent}H{h['level']}: {h['text']}")
 
-    images = extract_image_references(content)
-    print(f"\nImages ({len(images)}):")
-    for img in images:
+    print(f"\nImages ({len(analysis.images)}):")
+    for img in analysis.images:
         print(f"  • {img['alt']}: {img['url']}")
 
-    is_valid, issues = validate_markdown_structure(content)
-    print(f"\nValidation: {'✅ Valid' if is_valid else '❌ Issues found'}")
-    if issues:
-        for issue in issues:
+    print(f"\nValidation: {'✅ Valid' if analysis.is_valid else '❌ Issues found'}")
+    if analysis.issues:
+        for issue in analysis.issues:
             print(f"  • {issue}")
@@ -5,6 +5,7 @@ Migrate from old folder structure to new dated structure
 
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 import argparse
@@ -34,50 +35,68 @@ def migrate_to_dated_structure(
 
     migrated_count = 0
 
-    # Migrate features
-    old_features = Path(old_base) / 'features'
-    if old_features.exists():
-        print("📄 Migrating features...")
-        for feature_file in old_features.glob('*.md'):
-            feature_slug = feature_file.stem
-            new_dir = Path(new_base) / 'features' / f"{release_date}_{feature_slug}"
-            new_dir.mkdir(parents=True, exist_ok=True)
-
-            shutil.copy2(feature_file, new_dir / feature_file.name)
-            print(f"   ✅ Migrated feature: {feature_slug}")
-            migrated_count += 1
-        print()
-
-    # Migrate changelogs
-    old_changelog = Path(old_base) / 'changelog'
-    if old_changelog.exists():
-        print("📣 Migrating changelogs...")
-        for feature_dir in old_changelog.iterdir():
-            if feature_dir.is_dir():
-                new_dir = Path(new_base) / 'changelogs' / release_date
+    # Copies are pure I/O, so they run on a thread pool while the tree is
+    # walked. Each section is (header, [(message, copy futures, counted)]);
+    # an item is only reported once its copies have finished.
+    sections = []
+
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as pool:
+        # Migrate features
+        old_features = Path(old_base) / 'features'
+        if old_features.exists():
+            items = []
+            for feature_file in old_features.glob('*.md'):
+                feature_slug = feature_file.stem
+                new_dir = Path(new_base) / 'features' / f"{release_date}_{feature_slug}"
                 new_dir.mkdir(parents=True, exist_ok=True)
 
+                copy = pool.submit(shutil.copy2, feature_file, new_dir / feature_file.name)
+                items.append((f"Migrated feature: {feature_slug}", [copy], True))
+            sections.append(("📄 Migrating features...", items))
+
+        # Migrate changelogs
+        old_changelog = Path(old_base) / 'changelog'
+        if old_changelog.exists():
+            items = []
+            # Every feature's announcements land in the same dated folder
+            new_dir = Path(new_base) / 'changelogs' / release_date
+            feature_dirs = [d for d in old_changelog.iterdir() if d.is_dir()]
+            if feature_dirs:
+                new_dir.mkdir(parents=True, exist_ok=True)
+
+            for feature_dir in feature_dirs:
                 # Copy all announcement files
+                copies = []
                 for file in feature_dir.glob('*'):
                     if file.is_file():
                         new_filename = f"{feature_dir.name}_{file.name}"
-                        shutil.copy2(file, new_dir / new_filename)
-
-                print(f"   ✅ Migrated changelog: {feature_dir.name}")
-                migrated_count += 1
-        print()
-
-    # Migrate screenshots (optional - keep in screenshots folder)
-    old_screenshots = Path(old_base) / 'screenshots'
-    if old_screenshots.exists():
-        print("📸 Copying screenshots...")
-        new_screenshots_dir = Path(new_base) / 'screenshots'
-        new_screenshots_dir.mkdir(parents=True, exist_ok=True)
-
-        for screenshot in old_screenshots.glob('*.png'):
-            shutil.copy2(screenshot, new_screenshots_dir / screenshot.name)
-            print(f"   ✅ Copied: {screenshot.name}")
-        print()
+                        copies.append(pool.submit(shutil.copy2, file, new_dir / new_filename))
+                items.append((f"Migrated changelog: {feature_dir.name}", copies, True))
+            sections.append(("📣 Migrating changelogs...", items))
+
+        # Migrate screenshots (optional - keep in screenshots folder)
+        old_screenshots = Path(old_base) / 'screenshots'
+        if old_screenshots.exists():
+            items = []
+            new_screenshots_dir = Path(new_base) / 'screenshots'
+            new_screenshots_dir.mkdir(parents=True, exist_ok=True)
+
+            # Pixel data only; the timestamps aren't worth the extra metadata calls
+            for screenshot in old_screenshots.glob('*.png'):
+                copy = pool.submit(shutil.copy, screenshot, new_screenshots_dir / screenshot.name)
+                items.append((f"Copied: {screenshot.name}", [copy], False))
+            sections.append(("📸 Copying screenshots...", items))
+
+        # Report in order as the copies complete; a failed copy raises here
+        for header, items in sections:
+            print(header)
+            for message, copies, counted in items:
+                for copy in copies:
+                    copy.result()
+                print(f"   ✅ {message}")
+                if counted:
+                    migrated_count += 1
+            print()
 
     print(f"✅ Migration complete! Migrated {migrated_count} items")
     print()
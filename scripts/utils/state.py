@@ -9,19 +9,36 @@ so we need to maintain our own state file to know which articles exist.
 
 import os
 import json
+import functools
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional
 import sys
 
-# Add parent directory to path for config import
+# Add parent directory to path for config import (imported where used)
 sys.path.insert(0, str(Path(__file__).parent.parent))
-import config as cfg
 
+# orjson's C encoder/decoder when installed; the state file grows with
+# every synced article and is rewritten on each save
+try:
+    import orjson
 
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+    _loads = json.loads
+
+
+@functools.lru_cache(maxsize=1)
 def get_state_file_path():
-    """Get the path to the state file from config"""
+    """Get the path to the state file from config (looked up once per process)"""
     try:
+        import config as cfg
         config = cfg.get_config()
         return config.get('state', {}).get(
             'sync_state_file',
@@ -31,21 +48,64 @@ def get_state_file_path():
         return './demo/docs/sync-state.json'
 
 
+# Last state loaded or saved, as ((mtime_ns, size), state). The stat key
+# lets load_state skip re-parsing the file until something else rewrites it.
+_state_cache = None
+
+# Open StateBatch blocks, whether one holds changes not yet written, and
+# the timestamp every change made inside it is stamped with
+_batch_depth = 0
+_batch_dirty = False
+_batch_now = None
+
+
+def _now() -> str:
+    """Current timestamp, or the open batch's timestamp"""
+    return _batch_now or datetime.now().isoformat()
+
+
+def _stat_key(path: str):
+    """(mtime_ns, size) of a file, or None if it doesn't exist"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
 def load_state() -> Dict:
     """
     Load Pylon sync state from file
 
+    The parsed state is cached until the file changes, so every call returns
+    the same dict: changes made to it are seen by later calls (and written by
+    the next save_state) even without saving. Read-only callers should use
+    get_article() or list_articles(), which return copies.
+
     Returns:
         Dict with state data including articles, collections, etc.
     """
+    global _state_cache
+
+    # Inside a batch the pending in-memory state is the current one
+    if _batch_dirty:
+        return _state_cache[1]
+
     state_file = get_state_file_path()
 
-    if os.path.exists(state_file):
-        with open(state_file, 'r') as f:
-            return json.load(f)
+    key = _stat_key(state_file)
+    if key is not None:
+        if _state_cache is not None and _state_cache[0] == key:
+            return _state_cache[1]
+
+        with open(state_file, 'rb') as f:
+            state = _loads(f.read())
+        _state_cache = (key, state)
+        return state
 
     # Initialize empty state if file doesn't exist
     try:
+        import config as cfg
         pylon_config = cfg.get_pylon_config()
         return {
             "knowledge_base_id": pylon_config['kb_id'],
@@ -65,46 +125,106 @@ def load_state() -> Dict:
         }
 
 
-def save_state(state: Dict):
+def save_state(state: Dict, now: Optional[str] = None):
     """
     Save Pylon sync state to file
 
     Args:
         state: State dictionary to save
+        now: ISO timestamp for last_updated (default: current time)
     """
+    global _state_cache, _batch_dirty
+
+    # Update last_updated timestamp
+    state['last_updated'] = now or _now()
+
+    # Inside a batch, keep it in memory; StateBatch writes it on exit
+    if _batch_depth:
+        _state_cache = (_state_cache[0] if _state_cache else None, state)
+        _batch_dirty = True
+        return
+
+    _write_state(state)
+
+
+def _write_state(state: Dict):
+    """Write state to the state file and remember it as the cached state"""
+    global _state_cache
+
     state_file = get_state_file_path()
 
     # Ensure directory exists
     state_path = Path(state_file)
     state_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Update last_updated timestamp
-    state['last_updated'] = datetime.now().isoformat()
+    # Serialize first and swap the file in whole, so a crash mid-write
+    # can't leave a truncated state file behind
+    payload = _dumps(state)
+    tmp_path = state_path.with_name(state_path.name + '.tmp')
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, state_path)
 
-    with open(state_file, 'w') as f:
-        json.dump(state, f, indent=2)
+    _state_cache = (_stat_key(state_file), state)
 
 
-def save_article(article_key: str, article_data: Dict):
+class StateBatch:
+    """
+    Group state changes into a single write
+
+    Inside the block, save_state (and so save_article,
+    update_article_sync_time and delete_article) only updates the state in
+    memory; the file is written once when the outermost block exits, even
+    if it exits with an exception, so nothing already synced is lost.
+    Everything changed in the block shares the timestamp taken on entry.
+
+        with StateBatch() as batch:
+            for key, data in created.items():
+                batch.save_article(key, data)
+    """
+
+    def __enter__(self):
+        global _batch_depth, _batch_now
+        if _batch_depth == 0:
+            _batch_now = datetime.now().isoformat()
+        _batch_depth += 1
+        self.now = _batch_now
+        self.state = load_state()
+        return self
+
+    def save_article(self, article_key: str, article_data: Dict):
+        """Save article information to the batched state (see save_article)"""
+        save_article(article_key, article_data, now=self.now)
+
+    def __exit__(self, exc_type, exc, tb):
+        global _batch_depth, _batch_dirty, _batch_now
+        _batch_depth -= 1
+        if _batch_depth == 0:
+            _batch_now = None
+            if _batch_dirty:
+                _batch_dirty = False
+                _write_state(_state_cache[1])
+        return False
+
+
+def save_article(article_key: str, article_data: Dict, now: Optional[str] = None):
     """
     Save article information to state
 
     Args:
         article_key: Unique key for the article (e.g., 'dashboards', 'getting-started')
         article_data: Article data dict with article_id, URLs, etc.
+        now: ISO timestamp to record as the sync time (default: current time)
     """
     state = load_state()
+    now = now or _now()
 
     # Add sync timestamp
-    article_data['synced_at'] = datetime.now().isoformat()
+    article_data['synced_at'] = now
 
     # Save to articles dict
-    if 'articles' not in state:
-        state['articles'] = {}
-
-    state['articles'][article_key] = article_data
+    state.setdefault('articles', {})[article_key] = article_data
 
-    save_state(state)
+    save_state(state, now=now)
 
     print(f"💾 State updated: {article_key}")
 
@@ -117,24 +237,28 @@ def get_article(article_key: str) -> Optional[Dict]:
         article_key: Unique key for the article
 
     Returns:
-        Article data dict, or None if not found
+        Copy of the article data dict, or None if not found
     """
     state = load_state()
-    return state.get('articles', {}).get(article_key)
+    article = state.get('articles', {}).get(article_key)
+    return dict(article) if article is not None else None
 
 
-def update_article_sync_time(article_key: str):
+def update_article_sync_time(article_key: str, now: Optional[str] = None):
     """
     Update the last sync time for an article
 
     Args:
         article_key: Unique key for the article
+        now: ISO timestamp to record as the sync time (default: current time)
     """
     state = load_state()
 
-    if article_key in state.get('articles', {}):
-        state['articles'][article_key]['synced_at'] = datetime.now().isoformat()
-        save_state(state)
+    article = state.get('articles', {}).get(article_key)
+    if article is not None:
+        now = now or _now()
+        article['synced_at'] = now
+        save_state(state, now=now)
 
 
 def delete_article(article_key: str):
@@ -149,8 +273,7 @@ def delete_article(article_key: str):
     """
     state = load_state()
 
-    if article_key in state.get('articles', {}):
-        del state['articles'][article_key]
+    if state.get('articles', {}).pop(article_key, None) is not None:
         save_state(state)
         print(f"🗑️  Removed from state: {article_key}")
     else:
@@ -162,10 +285,10 @@ def list_articles() -> Dict[str, Dict]:
     List all articles in state
 
     Returns:
-        Dict mapping article keys to article data
+        Dict mapping article keys to copies of their article data
     """
     state = load_state()
-    return state.get('articles', {})
+    return {key: dict(data) for key, data in state.get('articles', {}).items()}
 
 
 def print_state_summary():
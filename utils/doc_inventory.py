@@ -12,10 +12,12 @@ import os
 import sys
 from pathlib import Path
 from typing import List, Dict, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from datetime import datetime
 import json
 import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directory to path
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -27,8 +29,41 @@ if str(PROJECT_ROOT / 'scripts') not in sys.path:
 import config as cfg
 from scripts.utils import state as state_manager  # From scripts/utils, not project/utils
 
+# Dated feature folder: YYYY-MM-DD_slug
+_FEATURE_DATE_RE = re.compile(r'(\d{4}-\d{2}-\d{2})_(.+)')
 
-@dataclass
+# Directory name -> (priority, category); when a path has several, the lowest
+# priority wins, so docs/features/integrations/... still counts as a feature
+_PATH_CATEGORIES = {
+    'features': (0, 'features'),
+    'getting-started': (1, 'getting-started'),
+    'integrations': (2, 'integrations'),
+    'changelog': (3, 'changelog'),
+    'changelogs': (3, 'changelog'),
+}
+
+# Titles of previously scanned files: {abspath: [mtime_ns, size, title]}.
+# Bump the version whenever title extraction changes so old entries are dropped.
+TITLE_CACHE_PATH = Path.home() / '.cache' / 'max-doc-ai' / 'doc_titles.json'
+TITLE_CACHE_VERSION = 2
+
+# Threads for walking directories and reading titles; the work is almost
+# all filesystem syscalls, which release the GIL
+SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Dependency, build output and tool cache directories that never hold docs.
+# Hidden directories (.git, .venv, .next, ...) are skipped separately.
+_SKIP_DIRS = frozenset({
+    'node_modules', '__pycache__', 'venv', 'dist', 'build', 'target',
+    'coverage', 'out',
+})
+
+
+# __slots__ instead of a per-instance __dict__ where dataclasses support it (3.10+)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class DocumentInfo:
     """Information about a documentation file"""
     path: str
@@ -45,7 +80,21 @@ class DocumentInfo:
     public_url: Optional[str] = None
 
     def to_dict(self):
-        return asdict(self)
+        # Every field is a str/int/bool/None, so asdict's deep copy isn't needed
+        return {
+            'path': self.path,
+            'filename': self.filename,
+            'category': self.category,
+            'title': self.title,
+            'slug': self.slug,
+            'feature_date': self.feature_date,
+            'size_bytes': self.size_bytes,
+            'modified_at': self.modified_at,
+            'synced': self.synced,
+            'sync_provider': self.sync_provider,
+            'sync_date': self.sync_date,
+            'public_url': self.public_url,
+        }
 
 
 class DocumentInventory:
@@ -64,6 +113,15 @@ class DocumentInventory:
         self.base_paths = base_paths
         self.documents: List[DocumentInfo] = []
 
+        self._title_cache = self._load_title_cache()
+        self._title_cache_dirty = False
+
+        # Category and sync-status buckets of self.documents (see _buckets)
+        self._bucketed = None
+        self._bucketed_len = 0
+        self._by_category: Dict[str, List[DocumentInfo]] = {}
+        self._by_synced: Dict[bool, List[DocumentInfo]] = {True: [], False: []}
+
     def _get_default_paths(self) -> List[str]:
         """Get default documentation paths from config"""
         paths = []
@@ -108,72 +166,150 @@ class DocumentInventory:
 
         print(f"🔍 Scanning documentation in {len(self.base_paths)} location(s)...")
 
-        for base_path in self.base_paths:
-            print(f"\n📂 Scanning: {base_path}")
-            self._scan_directory(base_path)
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+            for base_path in self.base_paths:
+                print(f"\n📂 Scanning: {base_path}")
+                self.documents.extend(self._scan_directory(base_path, pool))
 
         # Load sync state and mark synced docs
         self._load_sync_state()
+        self._bucketed = None
+
+        self.save_title_cache()
 
         print(f"\n✅ Found {len(self.documents)} documentation file(s)")
 
         return self.documents
 
-    def _scan_directory(self, base_path: str):
-        """Recursively scan a directory for markdown files"""
-        for root, dirs, files in os.walk(base_path):
-            # Skip hidden directories and common excludes
-            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['node_modules', '__pycache__']]
-
-            for file in files:
-                if file.endswith('.md') and not file.startswith('.'):
-                    full_path = os.path.join(root, file)
-                    doc_info = self._parse_document(full_path, base_path)
-                    if doc_info:
-                        self.documents.append(doc_info)
-
-    def _parse_document(self, file_path: str, base_path: str) -> Optional[DocumentInfo]:
-        """Parse a markdown file and extract metadata"""
+    def _scan_directory(self, base_path: str, pool: ThreadPoolExecutor) -> List[DocumentInfo]:
+        """
+        Recursively scan a directory for markdown files
+
+        Each top-level subdirectory is walked on its own pool thread, then
+        the files are parsed (which reads their titles) on the pool too.
+        Results keep os.walk order: a directory's files before its
+        subdirectories, subdirectories in listing order.
+
+        Args:
+            base_path: Directory to scan
+            pool: Executor to run walks and parsing on
+
+        Returns:
+            DocumentInfo for every markdown file that could be parsed
+        """
+        files, subdirs = self._list_directory(base_path)
+        for walk in [pool.submit(self._walk_markdown, subdir) for subdir in subdirs]:
+            files.extend(walk.result())
+
+        docs = pool.map(lambda item: self._parse_document(item[0], base_path, item[1]), files)
+        return [doc for doc in docs if doc]
+
+    def _walk_markdown(self, root: str) -> List[tuple]:
+        """
+        Find markdown files under a directory, depth-first in os.walk order
+
+        Returns:
+            List of (path, stat_result) tuples
+        """
+        found = []
+        pending = [root]
+
+        while pending:
+            files, subdirs = self._list_directory(pending.pop())
+            found.extend(files)
+            # Stack: push in reverse so subdirectories are visited in order
+            pending.extend(reversed(subdirs))
+
+        return found
+
+    @staticmethod
+    def _list_directory(root: str):
+        """
+        List one directory's markdown files and subdirectories to descend into
+
+        Uses os.scandir so each file's stat comes from its directory entry
+        (cached, and free for the type checks) instead of a separate os.stat
+        call per file.
+
+        Returns:
+            Tuple of ([(path, stat_result), ...], [subdir_path, ...])
+        """
+        files = []
+        subdirs = []
+
+        try:
+            with os.scandir(root) as it:
+                entries = list(it)
+        except OSError:
+            return files, subdirs
+
+        for entry in entries:
+            name = entry.name
+            if name.startswith('.'):
+                continue
+
+            if entry.is_dir():
+                # Skip non-doc directories; like os.walk, don't follow symlinked dirs
+                if name not in _SKIP_DIRS and not entry.is_symlink():
+                    subdirs.append(entry.path)
+            elif name.endswith('.md'):
+                try:
+                    files.append((entry.path, entry.stat()))
+                except OSError:
+                    continue
+
+        return files, subdirs
+
+    def _parse_document(self, file_path: str, base_path: str,
+                        stat: Optional[os.stat_result] = None) -> Optional[DocumentInfo]:
+        """
+        Parse a markdown file and extract metadata
+
+        Args:
+            file_path: Path to the markdown file
+            base_path: Scan root the file was found under
+            stat: The file's stat result, if the caller already has it
+
+        Returns:
+            DocumentInfo, or None if the file couldn't be read
+        """
         try:
             # Get file stats
-            stat = os.stat(file_path)
+            if stat is None:
+                stat = os.stat(file_path)
             modified_at = datetime.fromtimestamp(stat.st_mtime).isoformat()
 
             # Determine category from path
             rel_path = os.path.relpath(file_path, base_path)
-            parts = Path(rel_path).parts
+            parts = rel_path.split(os.sep)
 
-            category = 'unknown'
             feature_date = None
             slug = None
 
-            # Try to infer category from path structure
-            if 'features' in parts:
-                category = 'features'
+            # Infer category from path structure: one dict probe per component
+            matches = [_PATH_CATEGORIES[part] for part in parts if part in _PATH_CATEGORIES]
+            category = min(matches)[1] if matches else 'unknown'
+
+            if category == 'features':
                 # Check for dated feature folders (YYYY-MM-DD_slug)
                 for part in parts:
-                    match = re.match(r'(\d{4}-\d{2}-\d{2})_(.+)', part)
+                    match = _FEATURE_DATE_RE.match(part)
                     if match:
                         feature_date = match.group(1)
                         slug = match.group(2)
                         break
-            elif 'getting-started' in parts:
-                category = 'getting-started'
-            elif 'integrations' in parts:
-                category = 'integrations'
-            elif 'changelog' in parts or 'changelogs' in parts:
-                category = 'changelog'
 
             # Extract title from markdown (first H1)
-            title = self._extract_title(file_path)
+            title = self._extract_title(file_path, stat)
 
             # Derive slug from filename if not already set
+            filename = os.path.basename(file_path)
             if not slug:
-                slug = Path(file_path).stem
+                slug = os.path.splitext(filename)[0]
 
             return DocumentInfo(
                 path=file_path,
-                filename=Path(file_path).name,
+                filename=filename,
                 category=category,
                 title=title,
                 slug=slug,
@@ -186,19 +322,87 @@ class DocumentInventory:
             print(f"   ⚠️  Error parsing {file_path}: {e}")
             return None
 
-    def _extract_title(self, file_path: str) -> Optional[str]:
-        """Extract title from markdown file (first H1)"""
+    @staticmethod
+    def _load_title_cache() -> Dict[str, list]:
+        """Load the title cache from disk; a missing or broken cache is just empty"""
         try:
-            with open(file_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line.startswith('# '):
-                        return line[2:].strip()
-                    # Stop after first 20 lines
-                    if f.tell() > 1000:
-                        break
-        except:
-            pass
+            data = json.loads(TITLE_CACHE_PATH.read_text())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get('version') != TITLE_CACHE_VERSION:
+            return {}
+        return data.get('titles', {})
+
+    def save_title_cache(self):
+        """Write the title cache back to disk if a scan added to it"""
+        if not self._title_cache_dirty:
+            return
+        try:
+            TITLE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = TITLE_CACHE_PATH.with_suffix('.tmp')
+            tmp_path.write_text(json.dumps({
+                'version': TITLE_CACHE_VERSION,
+                'titles': self._title_cache,
+            }))
+            os.replace(tmp_path, TITLE_CACHE_PATH)
+            self._title_cache_dirty = False
+        except OSError:
+            pass  # Failing to cache is not an error
+
+    def _extract_title(self, file_path: str,
+                       stat: Optional[os.stat_result] = None) -> Optional[str]:
+        """
+        Extract title from markdown file (first H1)
+
+        Args:
+            file_path: Path to the markdown file
+            stat: The file's stat result; when given, an unchanged file's
+                title is served from the title cache without opening it
+
+        Returns:
+            Title string, or None if no H1 found near the top
+        """
+        if stat is None:
+            return self._read_title(file_path)
+
+        key = os.path.abspath(file_path)
+        cached = self._title_cache.get(key)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+
+        title = self._read_title(file_path)
+        self._title_cache[key] = [stat.st_mtime_ns, stat.st_size, title]
+        self._title_cache_dirty = True
+        return title
+
+    @staticmethod
+    def _read_title(file_path: str) -> Optional[str]:
+        """
+        Read the first H1 from the first 1 KB of a markdown file
+
+        Works on the raw bytes: bytes.find jumps between '# ' candidates and
+        only the title line itself is decoded.
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                head = f.read(1024)
+        except OSError:
+            return None
+
+        pos = head.find(b'# ')
+        while pos >= 0:
+            line_start = head.rfind(b'\n', 0, pos) + 1
+            # Only indentation may precede the marker ('## ' is not an H1)
+            if not head[line_start:pos].strip():
+                end = head.find(b'\n', pos)
+                if end < 0:
+                    if len(head) == 1024:
+                        return None  # Cut off by the size limit
+                    end = len(head)
+                title = head[pos + 2:end].decode('utf-8', 'ignore').strip()
+                if title:
+                    return title
+            pos = head.find(b'# ', pos + 1)
         return None
 
     def _load_sync_state(self):
@@ -207,38 +411,74 @@ class DocumentInventory:
             state_data = state_manager.load_state()
             articles = state_data.get('articles', {})
 
+            # Index state entries once instead of scanning every entry for
+            # every doc. State keys are typically provider:category-slug, so
+            # each entry is indexed under the part after the provider and
+            # under every hyphen-separated tail of it ('features-foo-bar'
+            # -> 'foo-bar', 'bar'). Later entries win, as before.
+            by_key = {}
+            for order, (state_key, article_data) in enumerate(articles.items()):
+                suffix = state_key.split(':', 1)[-1]
+                entry = (order, article_data)
+                by_key[suffix] = entry
+                start = suffix.find('-')
+                while start >= 0:
+                    by_key[suffix[start + 1:]] = entry
+                    start = suffix.find('-', start + 1)
+
             for doc in self.documents:
                 # Try to find matching article in state
-                # State keys are typically: provider:category-slug
-                possible_keys = [
-                    f"{doc.category}-{doc.slug}",
-                    doc.slug,
+                matches = [
+                    match for match in (
+                        by_key.get(f"{doc.category}-{doc.slug}"),
+                        by_key.get(doc.slug),
+                    ) if match
                 ]
-
-                for state_key, article_data in articles.items():
-                    # Check if this state entry matches the doc
-                    for key in possible_keys:
-                        if key in state_key:
-                            doc.synced = True
-                            doc.sync_provider = article_data.get('provider', 'unknown')
-                            doc.sync_date = article_data.get('synced_at')
-                            doc.public_url = article_data.get('public_url')
-                            break
+                if matches:
+                    _, article_data = max(matches, key=lambda match: match[0])
+                    doc.synced = True
+                    doc.sync_provider = article_data.get('provider', 'unknown')
+                    doc.sync_date = article_data.get('synced_at')
+                    doc.public_url = article_data.get('public_url')
 
         except Exception as e:
             print(f"   ⚠️  Could not load sync state: {e}")
 
+    def _buckets(self):
+        """
+        Group documents by category and by sync status in one pass
+
+        The groups are rebuilt only when self.documents has been replaced or
+        grown since they were last built, so the filters below are lookups.
+        """
+        if self._bucketed is self.documents and self._bucketed_len == len(self.documents):
+            return
+
+        by_category = defaultdict(list)
+        by_synced = {True: [], False: []}
+        for doc in self.documents:
+            by_category[doc.category].append(doc)
+            by_synced[bool(doc.synced)].append(doc)
+
+        self._by_category = dict(by_category)
+        self._by_synced = by_synced
+        self._bucketed = self.documents
+        self._bucketed_len = len(self.documents)
+
     def filter_by_category(self, category: str) -> List[DocumentInfo]:
         """Filter documents by category"""
-        return [doc for doc in self.documents if doc.category == category]
+        self._buckets()
+        return list(self._by_category.get(category, []))
 
     def filter_synced(self, synced: bool = True) -> List[DocumentInfo]:
         """Filter documents by sync status"""
-        return [doc for doc in self.documents if doc.synced == synced]
+        self._buckets()
+        return list(self._by_synced[bool(synced)])
 
     def get_categories(self) -> List[str]:
         """Get list of unique categories"""
-        return sorted(set(doc.category for doc in self.documents))
+        self._buckets()
+        return sorted(self._by_category)
 
     def print_summary(self):
         """Print a formatted summary of the inventory"""
@@ -246,17 +486,18 @@ class DocumentInventory:
         print("📊 Documentation Inventory Summary")
         print("=" * 70)
 
+        self._buckets()
+
         # By category
-        categories = self.get_categories()
         print(f"\n📚 By Category:")
-        for category in categories:
-            docs = self.filter_by_category(category)
+        for category in sorted(self._by_category):
+            docs = self._by_category[category]
             synced_count = sum(1 for d in docs if d.synced)
             print(f"  {category}: {len(docs)} total, {synced_count} synced")
 
         # By sync status
-        synced = self.filter_synced(True)
-        unsynced = self.filter_synced(False)
+        synced = self._by_synced[True]
+        unsynced = self._by_synced[False]
 
         print(f"\n🔄 Sync Status:")
         print(f"  ✅ Synced: {len(synced)}")
@@ -278,10 +519,10 @@ class DocumentInventory:
         print("📄 Documentation Details")
         print("=" * 70)
 
-        categories = self.get_categories()
+        self._buckets()
 
-        for category in categories:
-            docs = self.filter_by_category(category)
+        for category in sorted(self._by_category):
+            docs = self._by_category[category]
 
             print(f"\n📁 {category.upper()} ({len(docs)} files)")
             print("-" * 70)
@@ -312,16 +553,33 @@ class DocumentInventory:
         print("\n" + "=" * 70 + "\n")
 
     def export_json(self, output_path: str):
-        """Export inventory to JSON"""
-        data = {
-            'scanned_at': datetime.now().isoformat(),
-            'total_documents': len(self.documents),
-            'categories': self.get_categories(),
-            'documents': [doc.to_dict() for doc in self.documents]
-        }
+        """
+        Export inventory to JSON
+
+        Documents are serialized and written one at a time rather than
+        collected into one big structure first, so peak memory doesn't grow
+        with the size of the export. The output is identical to
+        json.dump(..., indent=2) of the whole inventory.
+        """
+        def nested(value, level: int) -> str:
+            # indent=2 JSON for a value nested `level` deep
+            return json.dumps(value, indent=2).replace('\n', '\n' + '  ' * level)
 
         with open(output_path, 'w') as f:
-            json.dump(data, f, indent=2)
+            f.write('{\n')
+            f.write(f'  "scanned_at": {json.dumps(datetime.now().isoformat())},\n')
+            f.write(f'  "total_documents": {len(self.documents)},\n')
+            f.write(f'  "categories": {nested(self.get_categories(), 1)},\n')
+
+            if not self.documents:
+                f.write('  "documents": []\n}')
+            else:
+                f.write('  "documents": [\n')
+                for i, doc in enumerate(self.documents):
+                    if i:
+                        f.write(',\n')
+                    f.write('    ' + nested(doc.to_dict(), 2))
+                f.write('\n  ]\n}')
 
         print(f"✅ Inventory exported to: {output_path}")
 
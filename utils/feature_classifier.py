@@ -9,9 +9,12 @@ Automatically detect feature type to determine workflow steps:
 - DOCUMENTATION_ONLY: Docs changes, minimal workflow
 """
 
-from typing import List, Dict, Tuple
+from typing import List, Dict, Mapping, Tuple
+from types import MappingProxyType
 from enum import Enum
+import functools
 import re
+from collections import defaultdict
 
 
 class FeatureType(Enum):
@@ -23,6 +26,57 @@ class FeatureType(Enum):
     MIXED = "mixed"
 
 
+# Workflow steps to include for each feature type. Built once and shared by
+# every classification, so the step maps are read-only.
+WORKFLOWS: Dict[FeatureType, Mapping[str, bool]] = {
+    FeatureType.UI_CHANGE: MappingProxyType({
+        'research': True,
+        'capture_screenshots': True,
+        'upload_screenshots': True,
+        'create_documentation': True,
+        'sync_documentation': True,
+        'create_announcements': True,
+        'summary': True
+    }),
+    FeatureType.DATA_ENHANCEMENT: MappingProxyType({
+        'research': True,
+        'capture_screenshots': False,  # Skip
+        'upload_screenshots': False,   # Skip
+        'create_documentation': True,
+        'sync_documentation': True,
+        'create_announcements': True,
+        'summary': True
+    }),
+    FeatureType.INFRASTRUCTURE: MappingProxyType({
+        'research': True,
+        'capture_screenshots': False,
+        'upload_screenshots': False,
+        'create_documentation': True,
+        'sync_documentation': False,  # Optional
+        'create_announcements': False,  # Usually not needed
+        'summary': True
+    }),
+    FeatureType.DOCUMENTATION_ONLY: MappingProxyType({
+        'research': True,
+        'capture_screenshots': False,
+        'upload_screenshots': False,
+        'create_documentation': False,  # Already done
+        'sync_documentation': True,
+        'create_announcements': False,
+        'summary': True
+    }),
+    FeatureType.MIXED: MappingProxyType({
+        'research': True,
+        'capture_screenshots': True,
+        'upload_screenshots': True,
+        'create_documentation': True,
+        'sync_documentation': True,
+        'create_announcements': True,
+        'summary': True
+    }),
+}
+
+
 class FeatureClassifier:
     """Classify features based on code changes"""
 
@@ -70,12 +124,69 @@ class FeatureClassifier:
         r'/documentation/'
     ]
 
+    # Score for each category, in priority order
+    CATEGORY_SCORES = {'ui': 10, 'backend': 8, 'infra': 5, 'doc': 3}
+
+    # Commit message keywords for each hint
+    COMMIT_KEYWORDS = {
+        'has_ui_keywords': ['component', 'ui', 'view', 'page', 'modal', 'form', 'button'],
+        'has_data_keywords': ['export', 'csv', 'api', 'endpoint', 'query', 'column', 'field'],
+        'has_infra_keywords': ['config', 'setup', 'migration', 'schema', 'deps'],
+    }
+
+    # Combined category regex and per-hint keyword regexes, compiled on
+    # first use (see _category_re and _keyword_res)
+    _CATEGORY_RE = None
+    _KEYWORD_RES = None
+
     def __init__(self):
         self.ui_score = 0
         self.backend_score = 0
         self.infra_score = 0
         self.doc_score = 0
 
+    @classmethod
+    def _category_re(cls):
+        """
+        All four pattern lists as one regex, compiled the first time a file is
+        classified so importing the module costs nothing
+
+        Classifying a path is then a single match instead of a search per
+        pattern. Each branch is a lookahead over the whole path followed by
+        an empty named group; branches are tried in order from the start of
+        the path, which keeps the category priority (a plain alternation
+        would prefer whichever pattern matched leftmost).
+        """
+        if cls._CATEGORY_RE is None:
+            cls._CATEGORY_RE = re.compile(
+                '^(?:' + '|'.join(
+                    f"(?=.*?(?:{'|'.join(patterns)}))(?P<{category}>)"
+                    for category, patterns in (
+                        ('ui', cls.UI_PATTERNS),
+                        ('backend', cls.BACKEND_PATTERNS),
+                        ('infra', cls.INFRA_PATTERNS),
+                        ('doc', cls.DOC_PATTERNS),
+                    )
+                ) + ')',
+                re.DOTALL
+            )
+        return cls._CATEGORY_RE
+
+    @classmethod
+    def _keyword_res(cls) -> List[Tuple[str, 're.Pattern']]:
+        """
+        One alternation per commit hint, compiled on first use
+
+        Keywords match anywhere in the lowercased message, like the
+        substring checks they replace, but each hint is one regex search.
+        """
+        if cls._KEYWORD_RES is None:
+            cls._KEYWORD_RES = [
+                (hint, re.compile('|'.join(map(re.escape, keywords))))
+                for hint, keywords in cls.COMMIT_KEYWORDS.items()
+            ]
+        return cls._KEYWORD_RES
+
     def classify_file(self, filepath: str) -> Tuple[str, int]:
         """
         Classify a single file and return category with confidence score
@@ -84,25 +195,10 @@ class FeatureClassifier:
             Tuple of (category, score) where category is one of:
             'ui', 'backend', 'infra', 'doc', or 'unknown'
         """
-        # UI detection
-        for pattern in self.UI_PATTERNS:
-            if re.search(pattern, filepath):
-                return ('ui', 10)
-
-        # Backend detection
-        for pattern in self.BACKEND_PATTERNS:
-            if re.search(pattern, filepath):
-                return ('backend', 8)
-
-        # Infrastructure detection
-        for pattern in self.INFRA_PATTERNS:
-            if re.search(pattern, filepath):
-                return ('infra', 5)
-
-        # Documentation detection
-        for pattern in self.DOC_PATTERNS:
-            if re.search(pattern, filepath):
-                return ('doc', 3)
+        # UI, then backend, infrastructure and documentation detection
+        match = self._category_re().match(filepath)
+        if match:
+            return (match.lastgroup, self.CATEGORY_SCORES[match.lastgroup])
 
         return ('unknown', 1)
 
@@ -139,9 +235,16 @@ class FeatureClassifier:
 
         file_breakdown = []
 
+        # Same as classify_file per path, with the regex and score lookups
+        # bound once for the whole list (large PRs touch thousands of files)
+        match_category = self._category_re().match
+        category_scores = self.CATEGORY_SCORES
+
         for filepath in changed_files:
-            category, score = self.classify_file(filepath)
-            if category != 'unknown':
+            match = match_category(filepath)
+            if match:
+                category = match.lastgroup
+                score = category_scores[category]
                 scores[category] += score
                 file_breakdown.append({
                     'file': filepath,
@@ -153,8 +256,9 @@ class FeatureClassifier:
         commit_hints = self._analyze_commits(commits) if commits else {}
 
         # Determine feature type based on scores
-        feature_type = self._determine_type(scores, commit_hints)
-        confidence = self._calculate_confidence(scores, feature_type)
+        total = sum(scores.values())
+        feature_type = self._determine_type(scores, total, commit_hints)
+        confidence = self._calculate_confidence(scores, total, feature_type)
         reasoning = self._build_reasoning(scores, file_breakdown, commit_hints, feature_type)
 
         return {
@@ -174,81 +278,78 @@ class FeatureClassifier:
             'has_infra_keywords': False
         }
 
-        ui_keywords = ['component', 'ui', 'view', 'page', 'modal', 'form', 'button']
-        data_keywords = ['export', 'csv', 'api', 'endpoint', 'query', 'column', 'field']
-        infra_keywords = ['config', 'setup', 'migration', 'schema', 'deps']
+        checks = self._keyword_res()
 
         for commit in commits:
             message = commit.get('message', '').lower()
 
-            if any(kw in message for kw in ui_keywords):
-                hints['has_ui_keywords'] = True
-            if any(kw in message for kw in data_keywords):
-                hints['has_data_keywords'] = True
-            if any(kw in message for kw in infra_keywords):
-                hints['has_infra_keywords'] = True
+            # Only look for hints that haven't been found yet
+            for hint, pattern in checks:
+                if pattern.search(message):
+                    hints[hint] = True
+            checks = [(hint, pattern) for hint, pattern in checks if not hints[hint]]
+            if not checks:
+                break
 
         return hints
 
-    def _determine_type(self, scores: Dict, commit_hints: Dict) -> FeatureType:
-        """Determine feature type from scores and hints"""
-        total_score = sum(scores.values())
+    def _determine_type(self, scores: Dict, total: int, commit_hints: Dict) -> FeatureType:
+        """
+        Determine feature type from scores and hints
 
-        if total_score == 0:
+        Percentage thresholds are compared as integers (score * 100 > pct * total)
+        rather than by dividing; scores are whole numbers so this is exact.
+        """
+        if total == 0:
             return FeatureType.INFRASTRUCTURE
 
-        # Calculate percentages
-        ui_pct = (scores['ui'] / total_score) * 100 if total_score > 0 else 0
-        backend_pct = (scores['backend'] / total_score) * 100 if total_score > 0 else 0
-        doc_pct = (scores['doc'] / total_score) * 100 if total_score > 0 else 0
+        ui = scores['ui'] * 100
+        backend = scores['backend'] * 100
 
         # Pure documentation
-        if doc_pct > 80:
+        if scores['doc'] * 100 > 80 * total:
             return FeatureType.DOCUMENTATION_ONLY
 
         # UI changes (requires screenshots)
-        if ui_pct > 30:
+        if ui > 30 * total:
             return FeatureType.UI_CHANGE
 
         # Backend/data enhancement (no UI)
-        if backend_pct > 50 and ui_pct < 10:
+        if backend > 50 * total and ui < 10 * total:
             # Double-check with commit messages
             if commit_hints.get('has_data_keywords') and not commit_hints.get('has_ui_keywords'):
                 return FeatureType.DATA_ENHANCEMENT
             return FeatureType.DATA_ENHANCEMENT
 
         # Mixed changes
-        if ui_pct > 10 and backend_pct > 10:
+        if ui > 10 * total and backend > 10 * total:
             return FeatureType.MIXED
 
         # Default to infrastructure
         return FeatureType.INFRASTRUCTURE
 
-    def _calculate_confidence(self, scores: Dict, feature_type: FeatureType) -> int:
+    def _calculate_confidence(self, scores: Dict, total: int, feature_type: FeatureType) -> int:
         """Calculate confidence score (0-100)"""
-        total = sum(scores.values())
-
         if total == 0:
             return 50  # Medium confidence for no files
 
         # For UI_CHANGE, confidence based on UI score dominance
         if feature_type == FeatureType.UI_CHANGE:
-            return min(100, int((scores['ui'] / total) * 150))
+            return min(100, scores['ui'] * 150 // total)
 
         # For DATA_ENHANCEMENT, confidence based on backend score
         if feature_type == FeatureType.DATA_ENHANCEMENT:
-            backend_ratio = scores['backend'] / total
-            ui_ratio = scores['ui'] / total
+            backend = scores['backend'] * 10
             # High confidence if backend dominant and no UI
-            if backend_ratio > 0.7 and ui_ratio < 0.1:
+            if backend > 7 * total and scores['ui'] * 10 < total:
                 return 95
-            elif backend_ratio > 0.5:
+            elif backend > 5 * total:
                 return 80
             return 60
 
         # For DOCUMENTATION_ONLY
         if feature_type == FeatureType.DOCUMENTATION_ONLY:
-            return min(100, int((scores['doc'] / total) * 120))
+            return min(100, scores['doc'] * 120 // total)
 
         # For MIXED or INFRASTRUCTURE
         return 70
@@ -260,17 +361,22 @@ class FeatureClassifier:
 
         total = sum(scores.values())
 
+        # Group files by category in one pass
+        files_by_category = defaultdict(list)
+        for f in file_breakdown:
+            files_by_category[f['category']].append(f['file'])
+
         # File-based reasoning
         if scores['ui'] > 0:
-            ui_files = [f['file'] for f in file_breakdown if f['category'] == 'ui']
+            ui_files = files_by_category['ui']
             reasons.append(f"Found {len(ui_files)} UI file(s): {', '.join(ui_files[:3])}")
 
         if scores['backend'] > 0:
-            backend_files = [f['file'] for f in file_breakdown if f['category'] == 'backend']
+            backend_files = files_by_category['backend']
             reasons.append(f"Found {len(backend_files)} backend file(s): {', '.join(backend_files[:3])}")
 
         if scores['doc'] > 0:
-            doc_files = [f['file'] for f in file_breakdown if f['category'] == 'doc']
+            doc_files = files_by_category['doc']
             reasons.append(f"Found {len(doc_files)} documentation file(s)")
 
         # Type-specific reasoning
@@ -294,57 +400,9 @@ class FeatureClassifier:
 
         return reasons
 
-    def _get_workflow(self, feature_type: FeatureType) -> Dict:
-        """Define which workflow steps to include for each feature type"""
-        workflows = {
-            FeatureType.UI_CHANGE: {
-                'research': True,
-                'capture_screenshots': True,
-                'upload_screenshots': True,
-                'create_documentation': True,
-                'sync_documentation': True,
-                'create_announcements': True,
-                'summary': True
-            },
-            FeatureType.DATA_ENHANCEMENT: {
-                'research': True,
-                'capture_screenshots': False,  # Skip
-                'upload_screenshots': False,   # Skip
-                'create_documentation': True,
-                'sync_documentation': True,
-                'create_announcements': True,
-                'summary': True
-            },
-            FeatureType.INFRASTRUCTURE: {
-                'research': True,
-                'capture_screenshots': False,
-                'upload_screenshots': False,
-                'create_documentation': True,
-                'sync_documentation': False,  # Optional
-                'create_announcements': False,  # Usually not needed
-                'summary': True
-            },
-            FeatureType.DOCUMENTATION_ONLY: {
-                'research': True,
-                'capture_screenshots': False,
-                'upload_screenshots': False,
-                'create_documentation': False,  # Already done
-                'sync_documentation': True,
-                'create_announcements': False,
-                'summary': True
-            },
-            FeatureType.MIXED: {
-                'research': True,
-                'capture_screenshots': True,
-                'upload_screenshots': True,
-                'create_documentation': True,
-                'sync_documentation': True,
-                'create_announcements': True,
-                'summary': True
-            }
-        }
-
-        return workflows.get(feature_type, workflows[FeatureType.MIXED])
+    def _get_workflow(self, feature_type: FeatureType) -> Mapping[str, bool]:
+        """Which workflow steps to include for a feature type (read-only, see WORKFLOWS)"""
+        return WORKFLOWS.get(feature_type, WORKFLOWS[FeatureType.MIXED])
 
 
 def classify_feature(changed_files: List[str], commits: List[Dict] = None) -> Dict:
@@ -356,8 +414,29 @@ def classify_feature(changed_files: List[str], commits: List[Dict] = None) -> Di
         print(f"Type: {result['type']}")
         print(f"Skip screenshots: {not result['workflow']['capture_screenshots']}")
     """
-    classifier = FeatureClassifier()
-    return classifier.classify(changed_files, commits)
+    # Only the file paths and commit messages affect the result, so they
+    # make the cache key; retries on the same PR then skip classification
+    messages = tuple(commit.get('message', '') for commit in commits) if commits else None
+    return _copy_result(_classify_cached(tuple(changed_files), messages))
+
+
+@functools.lru_cache(maxsize=256)
+def _classify_cached(changed_files: Tuple[str, ...], messages: Tuple[str, ...] = None) -> Dict:
+    """Classify hashable inputs; results are shared, so callers get copies"""
+    commits = [{'message': message} for message in messages] if messages is not None else None
+    return FeatureClassifier().classify(list(changed_files), commits)
+
+
+def _copy_result(result: Dict) -> Dict:
+    """Copy a cached classification so callers can't change the cached one"""
+    copied = {}
+    for key, value in result.items():
+        if isinstance(value, list):
+            value = [dict(item) if isinstance(item, dict) else item for item in value]
+        elif isinstance(value, dict):
+            value = dict(value)
+        copied[key] = value
+    return copied
 
 
 if __name__ == '__main__':
@@ -6,10 +6,14 @@ Implements the KBProvider interface for Pylon.
 """
 
 import os
+import mimetypes
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
 from typing import Dict, List, Optional
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directories to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'scripts'))
@@ -17,6 +21,13 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'scripts'))
 from utils.kb_providers.base import KBProvider, Article, ImageUpload, ArticleStatus
 from pylon import converter as pylon_converter
 
+# requests_toolbelt streams multipart bodies from the open file in chunks;
+# without it requests builds the whole body in memory first
+try:
+    from requests_toolbelt.multipart.encoder import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
 
 class PylonProvider(KBProvider):
     """Pylon-specific implementation of KBProvider"""
@@ -32,18 +43,39 @@ class PylonProvider(KBProvider):
                 - author_user_id: Default author ID
                 - api_base: Base URL (default: https://api.usepylon.com)
                 - collections: Dict mapping collection names to IDs
+                - upload_concurrency: Parallel image uploads (default: 8)
         """
         self.api_key = config['api_key']
         self.kb_id = config['kb_id']
         self.author_id = config.get('author_user_id')
         self.base_url = config.get('api_base', 'https://api.usepylon.com')
         self.collections = config.get('collections', {})
+        self.upload_concurrency = max(1, int(config.get('upload_concurrency', 8)))
 
         self.headers = {
             'Authorization': f'Bearer {self.api_key}',
             'Content-Type': 'application/json'
         }
 
+        # One pooled session for every API call, so requests reuse the
+        # TCP/TLS connection instead of handshaking each time. Retries only
+        # apply to idempotent methods (urllib3 default), so a create or
+        # upload POST is never sent twice.
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                raise_on_status=False
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
     @property
     def provider_name(self) -> str:
         return "pylon"
@@ -78,9 +110,8 @@ class PylonProvider(KBProvider):
         }
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 f'{self.base_url}/knowledge-bases/{self.kb_id}/articles',
-                headers=self.headers,
                 json=payload
             )
 
@@ -120,9 +151,8 @@ class PylonProvider(KBProvider):
             payload['title'] = article.title
 
         try:
-            response = requests.patch(
+            response = self.session.patch(
                 f'{self.base_url}/knowledge-bases/{self.kb_id}/articles/{article_id}',
-                headers=self.headers,
                 json=payload
             )
 
@@ -141,9 +171,8 @@ class PylonProvider(KBProvider):
     def get_article(self, article_id: str) -> Optional[Article]:
         """Retrieve an article by ID"""
         try:
-            response = requests.get(
-                f'{self.base_url}/knowledge-bases/{self.kb_id}/articles/{article_id}',
-                headers=self.headers
+            response = self.session.get(
+                f'{self.base_url}/knowledge-bases/{self.kb_id}/articles/{article_id}'
             )
 
             if response.status_code == 200:
@@ -160,9 +189,8 @@ class PylonProvider(KBProvider):
     def delete_article(self, article_id: str) -> bool:
         """Delete an article"""
         try:
-            response = requests.delete(
-                f'{self.base_url}/knowledge-bases/{self.kb_id}/articles/{article_id}',
-                headers=self.headers
+            response = self.session.delete(
+                f'{self.base_url}/knowledge-bases/{self.kb_id}/articles/{article_id}'
             )
 
             if response.status_code in [200, 204]:
@@ -198,11 +226,8 @@ class PylonProvider(KBProvider):
         print(f"📤 Uploading: {Path(image_path).name}...")
 
         filename = Path(image_path).name
+        mime_type = mimetypes.guess_type(image_path)[0] or 'application/octet-stream'
         with open(image_path, 'rb') as f:
-            files = {
-                'file': (filename, f, f'image/{Path(image_path).suffix[1:]}')
-            }
-
             data = {}
             if alt_text:
                 data['alt_text'] = alt_text
@@ -212,12 +237,21 @@ class PylonProvider(KBProvider):
             url = f'{self.base_url}/attachments'
 
             try:
-                response = requests.post(
-                    url,
-                    headers={'Authorization': f'Bearer {self.api_key}'},
-                    files=files,
-                    data=data
-                )
+                if MultipartEncoder is not None:
+                    encoder = MultipartEncoder(fields={**data, 'file': (filename, f, mime_type)})
+                    response = self.session.post(
+                        url,
+                        headers={'Content-Type': encoder.content_type},
+                        data=encoder
+                    )
+                else:
+                    # Drop the session's JSON Content-Type so requests sets the multipart one
+                    response = self.session.post(
+                        url,
+                        headers={'Content-Type': None},
+                        files={'file': (filename, f, mime_type)},
+                        data=data
+                    )
 
                 if response.status_code in [200, 201]:
                     result = response.json()
@@ -245,18 +279,27 @@ class PylonProvider(KBProvider):
                 return None
 
     def upload_images_batch(self, images: List[Dict]) -> Dict[str, ImageUpload]:
-        """Upload multiple screenshots"""
+        """
+        Upload multiple screenshots
+
+        Uploads run concurrently (upload_concurrency threads sharing the pooled
+        session), since each one is dominated by network latency. Results keep
+        the order of `images`.
+        """
         results = {}
 
         print(f"\n📤 Uploading {len(images)} images to Pylon...\n")
 
-        for img in images:
-            name = img.get('name')
-            path = img.get('path')
-            alt_text = img.get('alt', '')
-            caption = img.get('caption', '')
+        with ThreadPoolExecutor(max_workers=self.upload_concurrency) as executor:
+            futures = [
+                (img.get('name'), executor.submit(
+                    self.upload_image, img.get('path'), img.get('alt', ''), img.get('caption', '')
+                ))
+                for img in images
+            ]
 
-            result = self.upload_image(path, alt_text, caption)
+        for name, future in futures:
+            result = future.result()
 
             if result:
                 results[name] = result
@@ -300,9 +343,8 @@ class PylonProvider(KBProvider):
     def test_connection(self) -> bool:
         """Test the connection to Pylon"""
         try:
-            response = requests.get(
-                f'{self.base_url}/knowledge-bases/{self.kb_id}',
-                headers=self.headers
+            response = self.session.get(
+                f'{self.base_url}/knowledge-bases/{self.kb_id}'
             )
             return response.status_code == 200
         except Exception as e: